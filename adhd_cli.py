@@ -7,44 +7,62 @@ project initialization, module management, and project refresh operations.
 """
 # Add the current directory to Python path to allow imports
 import argparse
+import functools
 import subprocess
 import sys
 import os
-from pathlib import Path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def import_libs():
-    global ProjectInitializer, ModulesRefresher, refresh_specific_module, get_modules_controller, upgrade_framework, find_and_install_requirements
+# __file__ is already usable for import resolution, no need to abspath() it
+SCRIPT_DIR = os.path.dirname(__file__) or "."
+if sys.path[0] != SCRIPT_DIR:
+    sys.path.insert(0, SCRIPT_DIR)
 
-    from framework import (
-        ProjectInitializer,
-        ModulesRefresher,
-        refresh_specific_module,
-        get_modules_controller
-    )
-    from framework.install_requirements import find_and_install_requirements
-    from framework.upgrade import upgrade_framework
+def ensure_requirements():
+    """Install python requirements if the framework's dependencies are missing."""
+    try:
+        import framework
+    except ImportError:
+        requirements_file = "requirements.txt"
+        if os.path.exists(requirements_file):
+            print(f"📦 Installing python requirements from {requirements_file}...")
+            subprocess.run([sys.executable, "-m", "pip", "install", "-r", requirements_file],
+                        check=True)
 
-try:
-    import_libs()
-except ImportError as e:    
-    requirements_file = Path("requirements.txt")
-    if requirements_file.exists():
-        print(f"📦 Installing python requirements from {requirements_file}...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", str(requirements_file)],
-                    check=True)
-    import_libs()
 
+def cli_errors(label: str):
+    """Decorate a command so any unexpected error is reported once and exits with code 1."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(args):
+            try:
+                return func(args)
+            except Exception as e:
+                sys.stderr.write(f"❌ {label} failed: {str(e)}\n")
+                sys.exit(1)
+        return wrapper
+    return decorator
+
+
+def require_interactive_confirmation():
+    """Exit instead of blocking on a prompt when stdin is not a terminal."""
+    if not sys.stdin.isatty():
+        print("❌ Confirmation required but stdin is not interactive. Re-run with --yes to confirm.")
+        sys.exit(1)
 
+
+@cli_errors("Project initialization")
 def init_project(args):
     """Initialize a new ADHD project."""
     print("🚀 Initializing ADHD project...")
     
     # Handle force flag with confirmation
     force_update = False
-    if args.force:
+    if args.force and args.yes:
+        force_update = True
+    elif args.force:
         print("\n⚠️  WARNING: Force mode will update ALL modules regardless of version!")
         print("   This will overwrite existing modules even if they are newer.")
+        require_interactive_confirmation()
         response = input("   Are you sure you want to continue? (yes/no): ")
         if response.lower() in ['yes', 'y']:
             force_update = True
@@ -53,104 +71,88 @@ def init_project(args):
             print("❌ Operation cancelled.")
             return
     
+    from framework import ProjectInitializer
+
     yaml_file = args.config if args.config else "init.yaml"
-    
-    try:            
-        initializer = ProjectInitializer(yaml_file=yaml_file, force_update=force_update)
-        print("✅ Project initialization completed successfully!")
-    except Exception as e:
-        print(f"❌ Project initialization failed: {str(e)}")
-        sys.exit(1)
+    ProjectInitializer(yaml_file=yaml_file, force_update=force_update)
+    print("✅ Project initialization completed successfully!")
 
 
+@cli_errors("Project refresh")
 def refresh_project(args):
     """Refresh the project modules."""
+    from framework import ModulesRefresher, refresh_specific_module
+
     if args.module:
         print(f"🔄 Refreshing specific module: {args.module}")
         refresh_specific_module(args.module)
     else:
         print("🔄 Refreshing all project modules...")
-        try:
-            refresher = ModulesRefresher()
-            refresher.refresh_all_modules()
-            print("✅ Project refresh completed!")
-        except Exception as e:
-            print(f"❌ Project refresh failed: {str(e)}")
-            sys.exit(1)
+        refresher = ModulesRefresher()
+        refresher.refresh_all_modules()
+        print("✅ Project refresh completed!")
 
 
+@cli_errors("Listing modules")
 def list_modules(args):
     """List all discovered modules and their information."""
-    try:
-        controller = get_modules_controller()
-        controller.list_modules()
-    except Exception as e:
-        print(f"❌ Failed to list modules: {str(e)}")
-        sys.exit(1)
+    from framework import get_modules_controller
+
+    controller = get_modules_controller()
+    controller.list_modules()
 
 
+@cli_errors("Getting module information")
 def show_module_info(args):
     """Show detailed information about a specific module."""
     if not args.module:
         print("❌ Module name is required. Use --module MODULE_NAME")
         sys.exit(1)
     
-    try:
-        controller = get_modules_controller()
-        all_modules = controller.get_all_modules()
-        
-        # Find the module
-        found_module = None
-        found_path = None
-        for path, module_info in all_modules.items():
-            if module_info.name == args.module:
-                found_module = module_info
-                found_path = path
-                break
-        
-        if not found_module:
-            print(f"❌ Module '{args.module}' not found")
-            print("Available modules:")
-            for path, module_info in all_modules.items():
-                print(f"  • {module_info.name}")
-            sys.exit(1)
-        
-        # Display detailed module information using table formatter
-        from framework.cli_format import TableFormatter, TableRow
-        
-        formatter = TableFormatter()
-        rows = [
-            TableRow("📁", "Path", found_path),
-            TableRow("📂", "Type", found_module.type or 'Not specified'),
-            TableRow("🏷️", "Version", found_module.version),
-            TableRow("📃", "Description", found_module.description or 'No description available')
-        ]
-        
-        if found_module.folder_path:
-            rows.append(TableRow("🎯", "Target Path", found_module.folder_path))
-        
-        if found_module.requirements:
-            req_text = ", ".join(found_module.requirements)
-            if len(req_text) > 50:  # Truncate if too long
-                req_text = req_text[:47] + "..."
-            rows.append(TableRow("🔗", "Requirements", req_text))
-        
-        # Show features
-        features = found_module.features
-        if features:
-            features_text = ", ".join(features)
-            rows.append(TableRow("🔧", "Features", features_text))
-        else:
-            rows.append(TableRow("🔧", "Features", "None"))
-        
-        table = formatter.create_info_table(rows, f"📦 MODULE INFORMATION: {found_module.name}")
-        print(f"\n{table}")
-        
-    except Exception as e:
-        print(f"❌ Failed to get module information: {str(e)}")
+    from framework import get_modules_controller
+
+    controller = get_modules_controller()
+    all_modules = controller.get_all_modules()
+    
+    # Index modules by name for a single lookup
+    modules_by_name = {module_info.name: (path, module_info) for path, module_info in all_modules.items()}
+    found_path, found_module = modules_by_name.get(args.module, (None, None))
+    
+    if not found_module:
+        lines = [f"❌ Module '{args.module}' not found", "Available modules:"]
+        lines.extend(f"  • {module_name}" for module_name in modules_by_name)
+        sys.stdout.write("\n".join(lines) + "\n")
         sys.exit(1)
+    
+    # Display detailed module information using table formatter
+    from framework.cli_format import TableFormatter, TableRow
+    
+    formatter = TableFormatter()
+    formatter.set_title(f"📦 MODULE INFORMATION: {found_module.name}")
+    formatter.add_row(TableRow(f"📁 Path: {found_path}"))
+    formatter.add_row(TableRow(f"📂 Type: {found_module.type or 'Not specified'}"))
+    formatter.add_row(TableRow(f"🏷️ Version: {found_module.version}"))
+    formatter.add_row(TableRow(f"📃 Description: {found_module.description or 'No description available'}"))
+    
+    if found_module.folder_path:
+        formatter.add_row(TableRow(f"🎯 Target Path: {found_module.folder_path}"))
+    
+    if found_module.requirements:
+        req_text = ", ".join(found_module.requirements)
+        if len(req_text) > 50:  # Truncate if too long
+            req_text = req_text[:47] + "..."
+        formatter.add_row(TableRow(f"🔗 Requirements: {req_text}"))
+    
+    # Show features
+    features = found_module.features
+    features_text = ", ".join(features) if features else "None"
+    formatter.add_row(TableRow(f"🔧 Features: {features_text}"))
+    
+    # Emit the whole report in a single write
+    sys.stdout.write(f"\n{formatter.render('normal', 70)}\n")
 
 
+@cli_errors("Framework upgrade")
 def upgrade_framework_cmd(args):
     """Upgrade the framework from the self-template repository."""
     print("🚀 Upgrading ADHD Framework...")
@@ -158,54 +160,233 @@ def upgrade_framework_cmd(args):
     # Handle no-backup flag
     create_backup = not args.no_backup
     
-    if not create_backup:
+    if not create_backup and not args.yes:
         print("\n⚠️  WARNING: No backup will be created!")
         print("   Your current framework and CLI files will be overwritten.")
+        require_interactive_confirmation()
         response = input("   Are you sure you want to continue? (yes/no): ")
         if response.lower() not in ['yes', 'y']:
             print("❌ Upgrade cancelled.")
             return
     
+    from framework.upgrade import upgrade_framework
+
     yaml_file = args.config if args.config else "init.yaml"
-    
-    try:
-        success = upgrade_framework(yaml_file, create_backup)
-        if success:
-            print("✅ Framework upgrade completed successfully!")
-        else:
-            print("❌ Framework upgrade failed.")
-            sys.exit(1)
-    except Exception as e:
-        print(f"❌ Framework upgrade failed: {str(e)}")
+    if not upgrade_framework(yaml_file, create_backup):
+        print("❌ Framework upgrade failed.")
         sys.exit(1)
+    print("✅ Framework upgrade completed successfully!")
 
 
+@cli_errors("Requirements installation")
 def install_requirements(args):
     """Install requirements from all requirements.txt files in the project."""
     print("📦 Installing requirements from all requirements.txt files...")
     
-    try:
-        success = find_and_install_requirements()
-        if success:
-            print("✅ Requirements installation completed successfully!")
-        else:
-            print("❌ Some requirements failed to install.")
-            sys.exit(1)
-    except Exception as e:
-        print(f"❌ Requirements installation failed: {str(e)}")
+    from framework.install_requirements import find_and_install_requirements
+
+    if not find_and_install_requirements():
+        print("❌ Some requirements failed to install.")
         sys.exit(1)
+    print("✅ Requirements installation completed successfully!")
 
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="ADHD Framework CLI - AI-Driven High-speed Development Framework",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
+def daemon_socket_path() -> str:
+    """Path of the Unix socket used by the `serve` daemon."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "adhd.sock")
+    return os.path.join("/tmp", f"adhd-{os.getuid()}.sock")
+
+
+def forward_to_daemon(argv):
+    """
+    Run a command inside a warm `serve` daemon, writing straight to this process's stdout/stderr.
+    
+    Returns:
+        The command's exit code, or None if no daemon could be reached.
+    """
+    import json
+    import socket
+
+    sock_path = daemon_socket_path()
+    if not os.path.exists(sock_path):
+        return None
+    
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(sock_path)
+    except OSError:
+        return None
+    
+    with client:
+        # Hand over our stdout/stderr so git, pip and module scripts run by the daemon write here too
+        request = json.dumps({"cwd": os.getcwd(), "argv": argv}) + "\n"
+        sys.stdout.flush()
+        sys.stderr.flush()
+        socket.send_fds(client, [request.encode('utf-8')], [sys.stdout.fileno(), sys.stderr.fileno()])
+        with client.makefile('r', encoding='utf-8') as stream:
+            reply = stream.readline()
+    
+    if not reply:
+        return 1  # Daemon went away mid-command
+    return json.loads(reply)["exit"]
+
+
+def serve_daemon(args):
+    """Keep the framework loaded and serve CLI commands over a Unix socket."""
+    import io
+    import json
+    import socket
+    import socketserver
+
+    class DaemonRequestHandler(socketserver.BaseRequestHandler):
+        """Run one forwarded command in the daemon's warm interpreter, on the client's stdout/stderr."""
+        
+        def handle(self):
+            data, fds, _, _ = socket.recv_fds(self.request, 1 << 16, 2)
+            try:
+                while data and not data.endswith(b"\n"):
+                    chunk = self.request.recv(1 << 16)
+                    if not chunk:
+                        break
+                    data += chunk
+                if len(fds) != 2 or not data.endswith(b"\n"):
+                    exit_code = 1  # Not a client of this CLI
+                else:
+                    exit_code = self.run_request(json.loads(data), fds)
+            finally:
+                for fd in fds:
+                    os.close(fd)
+            self.request.sendall((json.dumps({"exit": exit_code}) + "\n").encode('utf-8'))
+        
+        @staticmethod
+        def run_request(request, fds) -> int:
+            """Run argv from the client's cwd with fds 1/2 pointing at its stdout/stderr; returns the exit code."""
+            exit_code = 0
+            previous_cwd = os.getcwd()
+            saved_fds = [os.dup(1), os.dup(2)]
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # Requests are served one at a time, so swapping the process-wide fds is safe
+            os.dup2(fds[0], 1)
+            os.dup2(fds[1], 2)
+            sys.stdin = io.StringIO()  # No interactive prompts through the daemon
+            try:
+                os.chdir(request["cwd"])
+                run_command(request["argv"])
+            except SystemExit as e:
+                if isinstance(e.code, int) or e.code is None:
+                    exit_code = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception as e:
+                print(f"❌ Command failed: {str(e)}", file=sys.stderr)
+                exit_code = 1
+            finally:
+                sys.stdin = sys.__stdin__
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os.dup2(saved_fds[0], 1)
+                os.dup2(saved_fds[1], 2)
+                for fd in saved_fds:
+                    os.close(fd)
+                os.chdir(previous_cwd)
+            return exit_code
+    
+    # Warm up the imports every command needs
+    ensure_requirements()
+    import framework
+    import framework.install_requirements
+    import framework.modules_control
+    import framework.project_init
+    import framework.project_refresh
+    import framework.upgrade
+    
+    sock_path = daemon_socket_path()
+    if os.path.exists(sock_path):
+        os.unlink(sock_path)  # Stale socket from a previous daemon
+    
+    with socketserver.UnixStreamServer(sock_path, DaemonRequestHandler) as server:
+        os.chmod(sock_path, 0o600)
+        print(f"🛰️  ADHD daemon listening on {sock_path}")
+        print("   Set ADHD_DAEMON=1 to route CLI commands through it. Press Ctrl+C to stop.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n🛑 ADHD daemon stopped")
+        finally:
+            os.unlink(sock_path)
+
+
+# Subcommand parsers stick to plain optionals. Avoid nargs='*' / REMAINDER
+# positionals mixed with many optionals: older argparse resolves those in
+# O(N²) over the argument tokens.
+
+# Every subcommand, in the order they are listed in --help: handler, help text
+# and its optional arguments as (flags, add_argument kwargs) pairs. Both the
+# argparse subparsers and the bare-command fast path are built from this table.
+COMMANDS = {
+    'init': (init_project, 'Initialize a new ADHD project', [
+        (('--config', '-c'), {'help': 'Path to YAML configuration file (default: init.yaml)'}),
+        (('--force', '-f'), {'action': 'store_true',
+                             'help': 'Force update all modules regardless of version (requires confirmation)'}),
+        (('--yes', '-y'), {'action': 'store_true', 'help': 'Skip the confirmation prompt for --force'}),
+    ]),
+    'refresh': (refresh_project, 'Refresh project modules', [
+        (('--module', '-m'), {'help': 'Refresh specific module by name'}),
+    ]),
+    'list': (list_modules, 'List all discovered modules', []),
+    'info': (show_module_info, 'Show detailed module information', [
+        (('--module', '-m'), {'required': True, 'help': 'Module name to show information for'}),
+    ]),
+    'req': (install_requirements, 'Install requirements from all requirements.txt files', []),
+    'upgrade': (upgrade_framework_cmd, 'Upgrade framework from self-template repository', [
+        (('--config', '-c'), {'help': 'Path to YAML configuration file (default: init.yaml)'}),
+        (('--no-backup',), {'action': 'store_true',
+                            'help': 'Skip creating backup before upgrade (requires confirmation)'}),
+        (('--yes', '-y'), {'action': 'store_true', 'help': 'Skip the confirmation prompt for --no-backup'}),
+    ]),
+    'serve': (serve_daemon, 'Run a daemon that keeps the framework loaded between commands', []),
+}
+
+
+def add_command_parser(subparsers, command: str):
+    """Add the parser for one subcommand from the COMMANDS table."""
+    func, help_text, arguments = COMMANDS[command]
+    command_parser = subparsers.add_parser(command, help=help_text)
+    for flags, options in arguments:
+        command_parser.add_argument(*flags, **options)
+    command_parser.set_defaults(func=func)
+    return command_parser
+
+
+def bare_command_defaults(command: str):
+    """
+    Argument values argparse would produce for a command given without flags.
+    
+    Returns:
+        The defaults as a dict, or None if the command has required arguments.
+    """
+    _, _, arguments = COMMANDS[command]
+    defaults = {}
+    for flags, options in arguments:
+        if options.get('required'):
+            return None
+        long_flag = next(flag for flag in flags if flag.startswith('--'))
+        dest = options.get('dest', long_flag[2:].replace('-', '_'))
+        implicit_default = False if options.get('action') == 'store_true' else None
+        defaults[dest] = options.get('default', implicit_default)
+    return defaults
+
+
+# Help epilog, built once at import and shared with the static help below
+EPILOG = """Examples:
   %(prog)s init                    # Initialize project with default init.yaml
   %(prog)s init --config my.yaml  # Initialize with custom config file
   %(prog)s init --force            # Force update all modules (with confirmation)
+  %(prog)s init --force --yes      # Force update without the confirmation prompt
   %(prog)s refresh                 # Refresh all modules
   %(prog)s refresh --module logger # Refresh specific module
   %(prog)s list                    # List all modules
@@ -213,57 +394,103 @@ Examples:
   %(prog)s req                      # Install all requirements.txt files in project
   %(prog)s upgrade                 # Upgrade framework from self-template repository
   %(prog)s upgrade --no-backup     # Upgrade without creating backup
-        """
+  %(prog)s upgrade --no-backup --yes # Upgrade without backup or confirmation prompt
+  %(prog)s serve                   # Keep a warm daemon (use with ADHD_DAEMON=1)
+"""
+
+# Pre-rendered top-level help, printed without building the argparse parser
+STATIC_HELP = """usage: %(prog)s [-h] {init,refresh,list,info,req,upgrade,serve} ...
+
+ADHD Framework CLI - AI-Driven High-speed Development Framework
+
+positional arguments:
+  {init,refresh,list,info,req,upgrade,serve}
+                        Available commands
+    init                Initialize a new ADHD project
+    refresh             Refresh project modules
+    list                List all discovered modules
+    info                Show detailed module information
+    req                 Install requirements from all requirements.txt files
+    upgrade             Upgrade framework from self-template repository
+    serve               Run a daemon that keeps the framework loaded between
+                        commands
+
+options:
+  -h, --help            show this help message and exit
+
+""" + EPILOG
+
+
+def build_parser(command=None, prog=None):
+    """Build the CLI parser with only `command`'s subparser, or every subparser if it is not a known command."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="ADHD Framework CLI - AI-Driven High-speed Development Framework",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
     )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    for name in ([command] if command in COMMANDS else COMMANDS):
+        add_command_parser(subparsers, name)
+    return parser
+
+
+def run_command(argv):
+    """Parse argv and run the matching command."""
+    # Fast path: a bare command needs no argument parsing
+    if len(argv) == 1 and argv[0] in COMMANDS:
+        defaults = bare_command_defaults(argv[0])
+        if defaults is not None:
+            ensure_requirements()
+            COMMANDS[argv[0]][0](argparse.Namespace(command=argv[0], **defaults))
+            return
     
-    # Init command
-    init_parser = subparsers.add_parser('init', help='Initialize a new ADHD project')
-    init_parser.add_argument('--config', '-c', 
-                           help='Path to YAML configuration file (default: init.yaml)')
-    init_parser.add_argument('--force', '-f', action='store_true',
-                           help='Force update all modules regardless of version (requires confirmation)')
-    init_parser.set_defaults(func=init_project)
-    
-    # Refresh command
-    refresh_parser = subparsers.add_parser('refresh', help='Refresh project modules')
-    refresh_parser.add_argument('--module', '-m', 
-                               help='Refresh specific module by name')
-    refresh_parser.set_defaults(func=refresh_project)
-    
-    # List command
-    list_parser = subparsers.add_parser('list', help='List all discovered modules')
-    list_parser.set_defaults(func=list_modules)
-    
-    # Info command
-    info_parser = subparsers.add_parser('info', help='Show detailed module information')
-    info_parser.add_argument('--module', '-m', required=True,
-                            help='Module name to show information for')
-    info_parser.set_defaults(func=show_module_info)
-    
-    # Install command
-    install_parser = subparsers.add_parser('req', help='Install requirements from all requirements.txt files')
-    install_parser.set_defaults(func=install_requirements)
-    
-    # Upgrade command
-    upgrade_parser = subparsers.add_parser('upgrade', help='Upgrade framework from self-template repository')
-    upgrade_parser.add_argument('--config', '-c', 
-                              help='Path to YAML configuration file (default: init.yaml)')
-    upgrade_parser.add_argument('--no-backup', action='store_true',
-                              help='Skip creating backup before upgrade (requires confirmation)')
-    upgrade_parser.set_defaults(func=upgrade_framework_cmd)
+    # Only build the invoked subcommand; build all of them for help or unknown commands
+    parser = build_parser(argv[0] if argv else None)
     
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
+    # Framework imports are deferred until a command actually runs
+    ensure_requirements()
+
     # Call the appropriate function
     args.func(args)
 
 
+def main():
+    """Main CLI entry point."""
+    prog = os.path.basename(sys.argv[0])
+    
+    # Fast path: top-level help needs no parser at all
+    if len(sys.argv) <= 1 or sys.argv[1] in ('-h', '--help'):
+        sys.stdout.write(STATIC_HELP % {'prog': prog})
+        sys.exit(0 if len(sys.argv) > 1 else 1)
+    
+    # Fast path: report unknown commands without building the parser
+    command = sys.argv[1]
+    if command not in COMMANDS and not command.startswith('-'):
+        import difflib
+        message = f"{prog}: unknown command '{command}'"
+        suggestion = difflib.get_close_matches(command, COMMANDS, n=1)
+        if suggestion:
+            message += f" — did you mean '{suggestion[0]}'?"
+        sys.stderr.write(f"{message}\nRun '{prog} --help' to see available commands.\n")
+        sys.exit(2)
+    
+    # Hand the command to a running `serve` daemon when asked to
+    if os.environ.get("ADHD_DAEMON") == "1" and command != 'serve':
+        exit_code = forward_to_daemon(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+    
+    run_command(sys.argv[1:])
+
+
 if __name__ == "__main__":
     main()
@@ -2,9 +2,17 @@
 ADHD Framework - Core modules for project initialization and management.
 """
 
-from .modules_control import ModulesController, get_modules_controller
-from .project_init import ProjectInitializer
-from .project_refresh import ModulesRefresher, refresh_specific_module
+import importlib
+
+# Public name -> defining submodule. Submodules are imported on first access (PEP 562),
+# so e.g. listing modules never pays for project_init's imports.
+_EXPORTS = {
+    'ModulesController': '.modules_control',
+    'get_modules_controller': '.modules_control',
+    'ProjectInitializer': '.project_init',
+    'ModulesRefresher': '.project_refresh',
+    'refresh_specific_module': '.project_refresh',
+}
 
 __all__ = [
     'ModulesController',
@@ -13,3 +21,15 @@ __all__ = [
     'ModulesRefresher',
     'refresh_specific_module'
 ]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value  # Later lookups skip this hook
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
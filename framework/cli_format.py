@@ -1,6 +1,7 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 from wcwidth import wcswidth
+import functools
 import os
 
 line_styles = {
@@ -11,25 +12,39 @@ line_styles = {
     "curly": {"┌": "╭", "─": "─", "┐": "╮", "│": "│", "├": "├", "┤": "┤", "└": "╰", "┘": "╯"}
 }
 
+# Rule above and below every StaticPrintout section header
+HEADER_RULE = "=" * 60
+
+
+@functools.lru_cache(maxsize=64)
+def horizontal_line(char: str, width: int) -> str:
+    """Border run of the given width, built once per (character, width)."""
+    return char * width
+
+
 @dataclass
 class TableRow:
     """Data class to represent a row in a table."""
     row: str = ""
     padding_adjust: int = 0
+    _width_cache: Optional[Tuple[str, int]] = field(default=None, init=False, repr=False, compare=False)
 
     def get_raw_len(self) -> int:
         """Get the raw length of the row without any formatting."""
         return len(self.row)
 
     def get_wcswidth(self) -> int:
-        """Get the width of the row considering wide characters."""
-        return wcswidth(self.row)
+        """Get the width of the row considering wide characters (computed once per row text)."""
+        if self._width_cache is None or self._width_cache[0] != self.row:
+            self._width_cache = (self.row, wcswidth(self.row))
+        return self._width_cache[1]
 
     def get_padding_len(self, table_width: int) -> int:
         """Calculate the padding length for the row based on the table width."""
         width = self.get_wcswidth()
-        if self.get_wcswidth() < self.get_raw_len():
-            width = self.get_wcswidth() + (self.get_raw_len() - self.get_wcswidth()) + 2 + self.padding_adjust
+        raw_len = self.get_raw_len()
+        if width < raw_len:
+            width = raw_len + 2 + self.padding_adjust
         return table_width - width
 
     def get_left_justified_row(self, table_width: int) -> str:
@@ -69,25 +84,26 @@ class TableFormatter:
         
         pref_table_width = max(pref_table_width, 20)  # Ensure a minimum width
         pref_table_width = max(pref_table_width, self.title.get_wcswidth() + 8)  # Ensure title fits
-        pref_table_width = max(pref_table_width, max((row.get_wcswidth() + 8) for row in self.table_row))  # Ensure rows fit
+        pref_table_width = max(pref_table_width, max((row.get_wcswidth() + 8 for row in self.table_row), default=0))  # Ensure rows fit
 
         lines = []
         style = line_styles[line_style_name]
+        horizontal = horizontal_line(style['─'], pref_table_width - 2)  # Shared by the top, separator and footer
         
-        lines.append(f"{style['┌']}{style['─'] * (pref_table_width - 2)}{style['┐']}")
+        lines.append(f"{style['┌']}{horizontal}{style['┐']}")
         
         # Title
         if self.title:
             title_line = f"{style['│']}{self.title.get_centered_row(pref_table_width)}{style['│']}"
             lines.append(title_line)
-            lines.append(f"{style['├']}{style['─'] * (pref_table_width - 2)}{style['┤']}")
+            lines.append(f"{style['├']}{horizontal}{style['┤']}")
 
         # Rows
         for table_row in self.table_row:
             lines.append(f"{style['│']}{table_row.get_left_justified_row(pref_table_width)}{style['│']}")
 
         # Footer
-        footer_line = f"{style['└']}{style['─'] * (pref_table_width - 2)}{style['┘']}"
+        footer_line = f"{style['└']}{horizontal}{style['┘']}"
         lines.append(footer_line)
         
         return "\n".join(lines)
@@ -101,24 +117,24 @@ class StaticPrintout:
     @staticmethod
     def project_init_header():
         """Print the project initialization header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("🚀 ADHD PROJECT INITIALIZATION")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def project_init_complete():
         """Print the project initialization completion message."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("🎉 PROJECT INITIALIZATION COMPLETE!")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
         print("🎯 Your ADHD project template is ready to use!")
         print("📝 Check the modules above for available functionality.")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
         print("💡 Next steps:")
         print("   • Review the initialized modules")
         print("   • Configure settings as needed")
         print("   • Start building your project!")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
         print("📍 Navigation:")
         print(f"   • If not in project directory: cd '{os.getcwd()}'")
         print("🔄 Re-initialization:")
@@ -128,63 +144,63 @@ class StaticPrintout:
         print("       python adhd_cli.py refresh")
         print("   • To list all modules: ")
         print("       python adhd_cli.py list")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def modules_scan_header():
         """Print the modules scanning header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("🔍 SCANNING MODULES AND CAPABILITIES")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def initialization_summary_header():
         """Print the initialization summary header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("📊 INITIALIZATION SUMMARY")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def final_module_status_header():
         """Print the final module status header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("📋 FINAL MODULE STATUS")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def module_placement_header():
         """Print the module placement header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("📦 MODULE PLACEMENT")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def configuration_loading_header():
         """Print the configuration loading header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("📄 LOADING CONFIGURATION")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def recursive_cloning_header():
         """Print the recursive cloning header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("⬇️  RECURSIVE REPOSITORY CLONING")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def recursive_cloning_summary_header():
         """Print the recursive cloning summary header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("📊 RECURSIVE CLONING SUMMARY")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def dependency_level_header(level: int):
         """Print the dependency level header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print(f"📦 DEPENDENCY LEVEL {level}")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def circular_dependency_warning(cycle_names: List[str], module_name: str):
@@ -197,18 +213,18 @@ class StaticPrintout:
     @staticmethod
     def framework_upgrade_header():
         """Print the framework upgrade header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("🚀 FRAMEWORK UPGRADE")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
         print("Upgrading from self-template repository")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def upgrade_summary_header():
         """Print the upgrade summary header."""
-        print(f"\n{'='*60}")
+        print(f"\n{HEADER_RULE}")
         print("📊 UPGRADE SUMMARY")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def upgrade_success_message():
@@ -225,7 +241,7 @@ class StaticPrintout:
         print("   • Check for any new dependencies in requirements.txt")
         print("   • Run 'python adhd_cli.py req' to install new requirements")
         print("   • Test your project to ensure everything works")
-        print(f"{'='*60}")
+        print(f"{HEADER_RULE}")
     
     @staticmethod
     def upgrade_failure_message():
@@ -237,4 +253,4 @@ class StaticPrintout:
         print("   • Verify the self-template-repo URL in init.yaml")
         print("   • Ensure you have git installed and accessible")
         print("   • Check that you have write permissions in this directory")
-        print(f"{'='*60}")
\ No newline at end of file
+        print(f"{HEADER_RULE}")
\ No newline at end of file
@@ -1,10 +1,30 @@
 import os
+import sys
+import hashlib
+import pickle
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-from .yaml_util import YamlUtil, YamlFile
+from .yaml_util import YamlUtil, YamlFile, YAML_CACHE_DIR
 
-@dataclass
+# Top-level init.yaml keys that make up a module's header
+MODULE_HEADER_KEYS = ["folder_path", "type", "version", "description", "requirements"]
+
+# Below this many modules a thread pool costs more than it overlaps
+PARALLEL_SCAN_THRESHOLD = 16
+
+# Bump when the cached module header layout changes so old cache files are ignored
+MODULE_CACHE_SCHEMA = 1
+
+# Feature labels and their has_init / has_refresh / has_config bits
+FEATURE_TABLE = (("✅ Init", 0b001), ("🔄 Refresh", 0b010), ("⚙️ Config", 0b100))
+# Every flag combination resolved up front, indexed by feature bitmask
+FEATURES_BY_MASK = tuple(
+    tuple(label for label, bit in FEATURE_TABLE if mask & bit) for mask in range(8)
+)
+
+@dataclass(slots=True)
 class ModuleInfo:
     """Data class to store module information"""
     path: str
@@ -17,28 +37,25 @@ class ModuleInfo:
     version: str = "0.0.1"
     description: str = ""
     requirements: List[str] = field(default_factory=list)
-    
-    def __post_init__(self):
-        """Post-initialization to set name from path if not provided"""
-        if not self.name:
-            self.name = os.path.basename(self.path)
+    init_path: str = ""  # Path of the module's __init__.py, set when it exists
     
     @property
     def features(self) -> List[str]:
         """Get list of available features for this module"""
-        features = []
-        if self.has_init:
-            features.append("✅ Init")
-        if self.has_refresh:
-            features.append("🔄 Refresh")
-        if self.has_config:
-            features.append("⚙️ Config")
-        return features
+        mask = self.has_init | (self.has_refresh << 1) | (self.has_config << 2)
+        return list(FEATURES_BY_MASK[mask])
 
 
 class ModulesController:
     """Controller for managing and providing information about project modules."""
     
+    # absolute init.yaml path -> ((mtime_ns, size, inode), parsed module fields), shared by all
+    # instances and persisted per project so later runs only re-parse changed files
+    _yaml_info_cache: Optional[Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]]] = None
+    _yaml_info_cache_file: Optional[Path] = None
+    _yaml_info_cache_dirty = False
+    _yaml_info_cache_lock = threading.Lock()  # Cloner workers may trigger the first load concurrently
+    
     def __init__(self):
         self.base_dirs = ["managers", "utils", "plugins", "mcps", "cores"]
         self.modules_info: Dict[str, ModuleInfo] = {}
@@ -48,53 +65,143 @@ class ModulesController:
         """Scan for modules in the base directories."""
         # print("Scanning for modules...")  # Uncomment for debugging
         
+        module_paths = []
         for base_dir in self.base_dirs:
             if os.path.exists(base_dir):
-                self._scan_directory(base_dir)
+                module_paths.extend(self._scan_directory(base_dir))
+        
+        ModulesController._load_yaml_info_cache()  # Load once up front, before any worker threads
+        if len(module_paths) >= PARALLEL_SCAN_THRESHOLD:
+            # Reads are independent per module; overlap their filesystem latency
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                module_infos = list(executor.map(ModulesController.get_module_info_from_path, module_paths))
+        else:
+            module_infos = [ModulesController.get_module_info_from_path(path) for path in module_paths]
+        
+        for module_path, module_info in zip(module_paths, module_infos):
+            if module_info:
+                self.modules_info[module_path] = module_info
+        ModulesController._save_yaml_info_cache()
         
         # print(f"Found {len(self.modules_info)} modules")  # Uncomment for debugging
     
-    def _scan_directory(self, directory: str):
-        """Scan a specific directory for modules."""
-        for item in os.listdir(directory):
-            item_path = os.path.join(directory, item)
-            if os.path.isdir(item_path) and not item.startswith('_') and not item.startswith('__') and not item.startswith('.'):
-                module_info = ModulesController.get_module_info_from_path(item_path)
-                if module_info:
-                    self.modules_info[item_path] = module_info
+    def _scan_directory(self, directory: str) -> List[str]:
+        """List candidate module folders in a specific directory."""
+        # scandir reports entry types from the directory listing, no stat per entry
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries
+                    if not entry.name.startswith(('_', '.')) and entry.is_dir()]
 
     
     @staticmethod
     def get_module_info_from_path(module_path: str) -> Optional[ModuleInfo]:
         """Get information about a specific module without scanning the entire project."""
-        if not os.path.exists(module_path):
+        module_path = os.fspath(module_path)
+        # One directory listing instead of an exists() probe per well-known file
+        try:
+            with os.scandir(module_path) as entries:
+                file_names = {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
             return None
-        # Create basic module info
+        except NotADirectoryError:
+            file_names = set()
+        
+        # Create basic module info; module_path is a directory, so plain concatenation joins safely
+        prefix = module_path if module_path.endswith(os.sep) else module_path + os.sep
+        has_init = "__init__.py" in file_names
         module_info = ModuleInfo(
             path=module_path,
-            name=os.path.basename(module_path),
-            has_init=os.path.exists(os.path.join(module_path, "__init__.py")),
-            has_refresh=os.path.exists(os.path.join(module_path, "refresh.py")),
-            has_config=os.path.exists(os.path.join(module_path, "init.yaml")),
+            name=os.path.basename(module_path.rstrip(os.sep)),
+            has_init=has_init,
+            init_path=prefix + "__init__.py" if has_init else "",
+            has_refresh="refresh.py" in file_names,
+            has_config="init.yaml" in file_names,
         )
         
         # Try to read init.yaml for additional information
-        init_yaml_path = os.path.join(module_path, "init.yaml")
-        if os.path.exists(init_yaml_path):
-            yaml_file = YamlUtil.read_yaml(init_yaml_path)
-            if yaml_file:
-                # Update module info with YAML data
-                module_info.folder_path = yaml_file.get("folder_path", "")
-                module_info.type = yaml_file.get("type", "")
-                module_info.version = yaml_file.get("version", "0.0.1")
-                module_info.description = yaml_file.get("description", "")
-                
-                # Handle requirements (can be list or single string)
-                requirements = yaml_file.get("requirements", [])
-                module_info.requirements = requirements if isinstance(requirements, list) else [requirements]
+        yaml_info = None
+        if module_info.has_config:
+            yaml_info = ModulesController._read_module_yaml_info(prefix + "init.yaml")
+        if yaml_info:
+            # Update module info with YAML data
+            module_info.folder_path = yaml_info["folder_path"]
+            module_info.type = yaml_info["type"]
+            module_info.version = yaml_info["version"]
+            module_info.description = yaml_info["description"]
+            module_info.requirements = list(yaml_info["requirements"])
         
         return module_info
     
+    @staticmethod
+    def _read_module_yaml_info(init_yaml_path: str) -> Optional[Dict[str, Any]]:
+        """Read module fields from init.yaml, reusing the last parse while the file is unchanged."""
+        try:
+            stat = os.stat(init_yaml_path)
+        except OSError:
+            return None
+        
+        stat_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cache_path = os.path.abspath(init_yaml_path)
+        cached = ModulesController._load_yaml_info_cache().get(cache_path)
+        if cached and cached[0] == stat_key:
+            return cached[1]
+        
+        # Only the module header is needed, skip parsing any other top-level sections
+        yaml_file = YamlUtil.read_yaml_keys(init_yaml_path, MODULE_HEADER_KEYS)
+        if not yaml_file:
+            return None
+        
+        # Handle requirements (can be list or single string)
+        requirements = yaml_file.get("requirements", [])
+        yaml_info = {
+            "folder_path": yaml_file.get("folder_path", ""),
+            "type": yaml_file.get("type", ""),
+            "version": yaml_file.get("version", "0.0.1"),
+            "description": yaml_file.get("description", ""),
+            "requirements": requirements if isinstance(requirements, list) else [requirements],
+        }
+        ModulesController._yaml_info_cache[cache_path] = (stat_key, yaml_info)
+        ModulesController._yaml_info_cache_dirty = True
+        return yaml_info
+    
+    @classmethod
+    def _load_yaml_info_cache(cls) -> Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]]:
+        """Load the current project's persisted module header cache once per process."""
+        if cls._yaml_info_cache is not None:
+            return cls._yaml_info_cache
+        with cls._yaml_info_cache_lock:
+            if cls._yaml_info_cache is None:
+                project_key = hashlib.sha1(os.getcwd().encode('utf-8')).hexdigest()
+                cache_file = YAML_CACHE_DIR / f"modules-{project_key}.pkl"
+                entries = {}
+                try:
+                    with open(cache_file, 'rb') as cache:
+                        schema, loaded = pickle.load(cache)
+                    if schema == MODULE_CACHE_SCHEMA and isinstance(loaded, dict):
+                        entries = loaded
+                except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+                    pass  # Missing or unreadable cache, start empty
+                # Publish only the fully loaded cache so other threads never write into a dict about to be replaced
+                cls._yaml_info_cache_file = cache_file
+                cls._yaml_info_cache = entries
+        return cls._yaml_info_cache
+    
+    @classmethod
+    def _save_yaml_info_cache(cls):
+        """Write the module header cache back to disk if anything was parsed since the last save."""
+        if not cls._yaml_info_cache_dirty or cls._yaml_info_cache_file is None:
+            return
+        try:
+            cls._yaml_info_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cls._yaml_info_cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as cache:
+                pickle.dump((MODULE_CACHE_SCHEMA, cls._yaml_info_cache), cache, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cls._yaml_info_cache_file)
+            cls._yaml_info_cache_dirty = False
+        except (OSError, pickle.PicklingError):
+            pass  # Caching is best effort
+    
     def get_all_modules(self) -> Dict[str, ModuleInfo]:
         """Get information about all discovered modules as ModuleInfo objects."""
         return self.modules_info
@@ -113,31 +220,33 @@ class ModulesController:
             print("No modules found.")
             return
         
-        print(f"\nFound {len(self.modules_info)} modules:")
-        print("-" * 80)
+        # Build the whole listing first and write it once instead of a print per field
+        parts: List[str] = [f"\nFound {len(self.modules_info)} modules:", "-" * 80]
         
         for path, module in self.modules_info.items():
-            print(f"📁 {module.name} ({module.path})")
+            parts.append(f"📁 {module.name} ({module.path})")
             
             if module.type:
-                print(f"   📂 Type: {module.type}")
+                parts.append(f"   📂 Type: {module.type}")
             if module.version:
-                print(f"   🏷️ Version: {module.version}")
+                parts.append(f"   🏷️ Version: {module.version}")
             if module.description:
-                print(f"   📃 {module.description}")
+                parts.append(f"   📃 {module.description}")
             if module.folder_path:
-                print(f"   🎯 Target Path: {module.folder_path}")
+                parts.append(f"   🎯 Target Path: {module.folder_path}")
             
             # Show requirements if they exist
             if module.requirements:
-                print(f"   🔗 Requirements:")
-                for req in module.requirements:
-                    print(f"      • {req}")
+                parts.append(f"   🔗 Requirements:")
+                parts.extend(f"      • {req}" for req in module.requirements)
             
             # Show features
-            if module.features:
-                print(f"   🔧 Features: {', '.join(module.features)}")
-            print()
+            features = module.features
+            if features:
+                parts.append(f"   🔧 Features: {', '.join(features)}")
+            parts.append("")
+        
+        sys.stdout.write("\n".join(parts) + "\n")
 
 def get_modules_controller() -> ModulesController:
     """Get the modules controller instance."""
@@ -1,13 +1,82 @@
 from typing import List, Dict, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import functools
+import glob
+import graphlib
+import json
 import os
+import stat
 import subprocess
 import sys
+import tempfile
+import threading
 from pathlib import Path
 import shutil
 from .modules_control import ModulesController
 from .cli_format import TableFormatter, TableRow, StaticPrintout
 from .yaml_util import YamlUtil, YamlFile
 
+@functools.lru_cache(maxsize=256)
+def parse_version(version_str: str) -> tuple:
+    """Parse a 'v1.2.3' style version into a comparable tuple, (0, 0, 0) if invalid."""
+    try:
+        clean_version = version_str.lower().lstrip('v')
+        parts = clean_version.split('.')
+        return tuple(int(part) for part in parts[:3])
+    except (ValueError, AttributeError):
+        return (0, 0, 0)
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_repo_url(url: str) -> str:
+    """Normalize a repository URL for matching: case-insensitive, without surrounding whitespace, trailing '/' or '.git'."""
+    # removesuffix, not rstrip('.git'), which would also eat trailing 'g', 'i', 't' and '.'
+    return url.strip().rstrip('/').lower().removesuffix('.git')
+
+
+# The only remote init.yaml keys the cloner reads; requirements come from the cloned copy
+REMOTE_HEADER_KEYS = ["folder_path", "version"]
+
+# Parallel submodule fetches inside a single git clone
+SUBMODULE_JOBS = 8
+
+# Scratch directory for prepared clones; renamed to "<name>.del.<pid>" while it is deleted
+CLONE_TMP_DIR = ".adhd_clone_tmp"
+
+
+def ensure_dir(path) -> bool:
+    """Create a directory (and missing parents) with one mkdir in the common case; True if it was created."""
+    try:
+        os.mkdir(path)
+        return True
+    except FileExistsError:
+        return False
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)  # Missing parents, rare
+        return True
+
+
+def _make_writable_and_retry(function, path, error):
+    """rmtree error hook: clear the read-only bit (git object files on Windows) and retry once."""
+    if not isinstance(error, PermissionError):
+        raise error
+    os.chmod(path, os.lstat(path).st_mode | stat.S_IWRITE)
+    function(path)
+
+
+def _make_writable_and_retry_exc_info(function, path, exc_info):
+    """Pre-3.12 rmtree onerror hook: same as _make_writable_and_retry, given an exc_info tuple."""
+    _make_writable_and_retry(function, path, exc_info[1])
+
+
+def remove_tree(path):
+    """Remove a directory tree, raising instead of silently leaving a partial delete behind."""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_make_writable_and_retry)
+    else:
+        shutil.rmtree(path, onerror=_make_writable_and_retry_exc_info)
+
+
 class ProjectInitializer:
     """A class to handle the initialization of a project by cloning repositories."""
     
@@ -15,11 +84,8 @@ class ProjectInitializer:
         StaticPrintout.project_init_header()
         print("📂 Creating project directory structure...")
         
-        os.makedirs("managers", exist_ok=True)
-        os.makedirs("utils", exist_ok=True)
-        os.makedirs("plugins", exist_ok=True)
-        os.makedirs("mcps", exist_ok=True)
-        os.makedirs("cores", exist_ok=True)
+        for base_dir in ("managers", "utils", "plugins", "mcps", "cores"):
+            ensure_dir(base_dir)
         print("✅ Directory structure ready")
         
         self.yaml_loader = InitYamlLoader(yaml_file)
@@ -28,9 +94,19 @@ class ProjectInitializer:
         # Optional SSH support for private repos via env flags
         use_ssh = os.environ.get("ADHD_USE_SSH", "0").strip() in ("1", "true", "yes", "on")
         ssh_key = os.environ.get("ADHD_SSH_KEY")
+        # Opt-in: share one SSH connection per host across clones (ssh ControlMaster)
+        ssh_multiplex = os.environ.get("ADHD_SSH_MULTIPLEX", "0").strip() in ("1", "true", "yes", "on")
+        # Number of repositories cloned concurrently within a dependency level
+        clone_jobs = max(1, int(os.environ.get("ADHD_CLONE_JOBS", "8")))
+        # Shallow clones by default; set ADHD_SHALLOW_CLONE=0 to fetch full history
+        shallow = os.environ.get("ADHD_SHALLOW_CLONE", "1").strip() in ("1", "true", "yes", "on")
+        # Opt-in: set ADHD_CLONE_SUBMODULES=1 to fetch submodules with each module
+        submodules = os.environ.get("ADHD_CLONE_SUBMODULES", "0").strip() in ("1", "true", "yes", "on")
+        # Module __init__.py scripts run one at a time unless ADHD_INIT_JOBS > 1
+        init_jobs = max(1, int(os.environ.get("ADHD_INIT_JOBS", "1")))
 
         if repo_urls:
-            self.rc = RepositoryCloner(repo_urls, force_update=force_update, use_ssh=use_ssh, ssh_key=ssh_key)
+            self.rc = RepositoryCloner(repo_urls, force_update=force_update, use_ssh=use_ssh, ssh_key=ssh_key, max_workers=clone_jobs, shallow=shallow, submodules=submodules, ssh_multiplex=ssh_multiplex)
             modules_paths = self.rc.clone_all_repositories_recursive()
             url_to_path_mapping = self.rc.get_url_to_path_mapping()
         else:
@@ -40,7 +116,7 @@ class ProjectInitializer:
         
         # Use ModulesController to get better module information
         self.modules_controller = ModulesController()
-        self.modules_initializer = ModulesInitializer(modules_paths, self.modules_controller, url_to_path_mapping)
+        self.modules_initializer = ModulesInitializer(modules_paths, self.modules_controller, url_to_path_mapping, init_jobs=init_jobs)
         self.modules_initializer.initialize_modules()
         # self.append_requirements()
         self.create_vscode_workspace()
@@ -51,17 +127,32 @@ class ProjectInitializer:
         """Find all requirements.txt files in modules and append them to the main requirements.txt."""
         print("📦 Appending requirements from modules...")
         
-        requirements_file = Path("requirements.txt")
-        os.makedirs(requirements_file.parent, exist_ok=True)
-
-        with open(requirements_file, 'a') as main_requirements:
-            for module_path in self.modules_controller.get_all_modules().keys():
-                module_requirements = Path(module_path) / "requirements.txt"
-                if module_requirements.exists():
-                    with open(module_requirements, 'r') as mod_req:
-                        content = mod_req.read()
-                        main_requirements.write(content + "\n")
-                        print(f"✅ Appended requirements from {module_path}")
+        requirements_file = "requirements.txt"
+        try:
+            with open(requirements_file, 'rb') as main_requirements:
+                existing = main_requirements.read()
+        except FileNotFoundError:
+            existing = b""
+        seen = set(existing.splitlines())
+        
+        # Collect every module's new lines first, then append them in one write
+        new_lines = []
+        for module_path in self.modules_controller.get_all_modules():
+            try:
+                with open(os.path.join(module_path, "requirements.txt"), 'rb') as mod_req:
+                    lines = mod_req.read().splitlines()
+            except FileNotFoundError:
+                continue
+            for line in lines:
+                if line.strip() and line not in seen:
+                    seen.add(line)
+                    new_lines.append(line)
+            print(f"✅ Appended requirements from {module_path}")
+        
+        if new_lines:
+            separator = b"\n" if existing and not existing.endswith(b"\n") else b""
+            with open(requirements_file, 'ab') as main_requirements:
+                main_requirements.write(separator + b"\n".join(new_lines) + b"\n")
         
         print("📦 All module requirements appended successfully!")
 
@@ -81,76 +172,236 @@ class ProjectInitializer:
         try:
             
             # Find all directories with .git folders and create workspace entries
-            result = subprocess.run(
-                ['find', '.', '-mindepth', '2', '-type', 'd', '-name', '.git'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            repo_dirs = self._find_nested_git_repos()
             
-            if result.stdout.strip():
-                # Process the output to create workspace entries
-                git_dirs = result.stdout.strip().split('\n')
-                git_dirs.append("./.git")
-                workspace_entries = []
-                
-                for git_dir in git_dirs:
-                    # Remove /.git suffix to get the module path
-                    module_path = git_dir.replace('/.git', '')
-                    workspace_entries.append(f'    {{ "path": "{module_path}" }}')
-                
-                # Create workspace content with proper formatting
-                workspace_content = "{"
-                workspace_content += f"""\n\t"folders": [\n\t{",\n\t".join(workspace_entries)}\n\t],"""
-                workspace_content += """\n\t"settings": {\n\t\t"python.analysis.extraPaths": [\n\t\t\t"../../../",\n\t\t\t"../../",\n\t\t\t"../",\n\t\t]\n\t}"""
-                workspace_content += "\n}"
+            if repo_dirs:
+                repo_dirs.append(".")
+                workspace = {
+                    "folders": [{"path": module_path} for module_path in repo_dirs],
+                    "settings": {
+                        "python.analysis.extraPaths": ["../../../", "../../", "../"],
+                    },
+                }
 
                 # Write workspace file
                 with open(workspace_file, 'w') as f:
-                    f.write(workspace_content)
+                    json.dump(workspace, f, indent="\t")
+                    f.write("\n")
                 
                 print(f"✅ Created VSCode workspace: {workspace_file}")
-                print(f"📁 Added {len(workspace_entries)} module(s) to workspace")
+                print(f"📁 Added {len(repo_dirs)} module(s) to workspace")
             else:
                 print("⚠️  No git repositories found to add to workspace")
                 
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Error creating workspace: {e}")
         except Exception as e:
             print(f"❌ Unexpected error creating workspace: {str(e)}")
 
+    @staticmethod
+    def _find_nested_git_repos() -> List[str]:
+        """List directories below '.' that contain a .git directory (like find -mindepth 2 -name .git)."""
+        repo_dirs = []
+        stack = ["."]
+        while stack:
+            directory = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # d_type from the listing, no stat; symlinks are not followed
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        if directory == "." and entry.name.startswith(CLONE_TMP_DIR):
+                            continue  # Scratch clones, possibly still being deleted
+                        if entry.name == ".git":
+                            if directory != ".":
+                                repo_dirs.append(directory)
+                        else:
+                            subdirs.append(entry.path)
+            except OSError:
+                continue  # Unreadable directory, find would skip it too
+            stack.extend(reversed(subdirs))  # Visit in listing order
+        return repo_dirs
+
+
+class _ThreadBufferedStdout:
+    """Stdout proxy that collects each worker thread's output so parallel modules print as whole blocks."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def start_capture(self):
+        """Buffer everything the current thread writes until stop_capture."""
+        self._local.buffer = []
+    
+    def stop_capture(self) -> str:
+        """Stop buffering for the current thread and return what it wrote."""
+        buffer = self._local.__dict__.pop('buffer', [])
+        return ''.join(buffer)
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            return self._stream.write(text)
+        buffer.append(text)
+        return len(text)
+    
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
 
 class ModulesInitializer:
     """A class to handle the initialization of modules with dependency resolution."""
     
-    def __init__(self, modules: List[str], modules_controller: ModulesController, url_to_path_mapping: dict):
+    def __init__(self, modules: List[str], modules_controller: ModulesController, url_to_path_mapping: dict, init_jobs: int = 1):
         self.modules = modules
         self.modules_controller = modules_controller
         self.url_to_path_mapping = url_to_path_mapping
+        self.init_jobs = init_jobs
+        self._build_dependency_indexes()
         self.initialized_modules = set()  # Track successfully initialized modules
-        self.initialization_chain = []    # Track current initialization chain for cycle detection
+        self.initialization_chain = []    # Track current initialization chain for cycle reports
+        self.initialization_chain_set = set()  # Same modules as initialization_chain, for O(1) cycle checks
         self.failed_modules = set()       # Track modules that failed to initialize
+        self._module_info_cache = {}      # Module infos read from disk for paths missing from the scan
 
     def initialize_modules(self):
         """Initialize all modules with proper dependency resolution."""
         StaticPrintout.modules_scan_header()
         
-        # Get updated module information after placement
-        self.modules_controller._scan_modules()
+        # The controller is created after placement, so its scan is already up to date
         all_modules_info = self.modules_controller.get_all_modules()
         
         print(f"📋 Found {len(self.modules)} modules to initialize")
         print(f"🔗 Dependency mapping contains {len(self.url_to_path_mapping)} URL-to-path mappings")
         
-        # Initialize each module (dependencies will be handled recursively)
-        for module_path in self.modules:
-            if module_path not in self.initialized_modules and module_path not in self.failed_modules:
-                self._initialize_module_with_dependencies(module_path, all_modules_info)
+        sorter = self._plan_initialization_order(all_modules_info) if self.init_jobs > 1 else None
+        if sorter is not None:
+            self._initialize_in_parallel(sorter, all_modules_info)
+        else:
+            # Initialize each module (dependencies are initialized first)
+            for module_path in self.modules:
+                if module_path not in self.initialized_modules and module_path not in self.failed_modules:
+                    self._initialize_module_with_dependencies(module_path, all_modules_info)
         
         self._print_initialization_summary()
 
+    def _get_module_info(self, module_path: str, all_modules_info: dict):
+        """Module info from the scan, falling back to a single memoized read from disk."""
+        module_info = all_modules_info.get(module_path)
+        if module_info:
+            return module_info
+        if module_path not in self._module_info_cache:
+            self._module_info_cache[module_path] = ModulesController.get_module_info_from_path(module_path)
+        return self._module_info_cache[module_path]
+
+    def _plan_initialization_order(self, all_modules_info: dict) -> Optional[graphlib.TopologicalSorter]:
+        """Build a prepared topological sorter over all modules and their dependencies; None on a cycle."""
+        dependencies: Dict[str, List[str]] = {}
+        discovered = list(self.modules)
+        for module_path in discovered:  # grows as dependencies are found
+            if module_path in dependencies:
+                continue
+            module_info = self._get_module_info(module_path, all_modules_info)
+            module_dependencies = []
+            for requirement_url in (module_info.requirements if module_info else []):
+                dependency_path = self._resolve_dependency_path(requirement_url)
+                if dependency_path and dependency_path not in module_dependencies:
+                    module_dependencies.append(dependency_path)
+                    discovered.append(dependency_path)
+            dependencies[module_path] = module_dependencies
+        
+        sorter = graphlib.TopologicalSorter(dependencies)
+        try:
+            sorter.prepare()
+        except graphlib.CycleError as error:
+            # CycleError lists dependencies before dependents, print it as "requires" arrows
+            cycle_names = " → ".join(os.path.basename(path) for path in reversed(error.args[1]))
+            print(f"⚠️  Dependency cycle detected ({cycle_names}), initializing modules one at a time")
+            return None
+        
+        print(f"⚡ Initializing {len(dependencies)} modules with up to {self.init_jobs} parallel jobs")
+        return sorter
+
+    def _initialize_in_parallel(self, sorter: graphlib.TopologicalSorter, all_modules_info: dict):
+        """Run modules concurrently, each one as soon as all of its dependencies are settled."""
+        stdout_proxy = _ThreadBufferedStdout(sys.stdout)
+        
+        def initialize_captured(module_path: str) -> str:
+            stdout_proxy.start_capture()
+            try:
+                self._initialize_settled_module(module_path, all_modules_info)
+            finally:
+                output = stdout_proxy.stop_capture()
+            return output
+        
+        sys.stdout = stdout_proxy
+        try:
+            with ThreadPoolExecutor(max_workers=self.init_jobs) as executor:
+                # The scripts are subprocesses, so threads only wait on them; set.add is atomic
+                running = {}
+                while sorter.is_active():
+                    for module_path in sorter.get_ready():
+                        running[executor.submit(initialize_captured, module_path)] = module_path
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        stdout_proxy.write(future.result())
+                        stdout_proxy.flush()
+                        sorter.done(running.pop(future))
+        finally:
+            sys.stdout = stdout_proxy._stream
+
+    def _initialize_settled_module(self, module_path: str, all_modules_info: dict) -> bool:
+        """Initialize a module whose dependencies have all already succeeded or failed."""
+        steps = self._initialize_module_steps(module_path, all_modules_info)
+        result = None
+        try:
+            while True:
+                result = self._get_initialization_state(steps.send(result))
+        except StopIteration as finished:
+            return finished.value
+
     def _initialize_module_with_dependencies(self, module_path: str, all_modules_info: dict) -> bool:
-        """Initialize a module and its dependencies recursively."""
+        """Initialize a module and its dependencies (dependencies first) without recursion.
+        
+        Each module in progress is a generator from _initialize_module_steps that yields
+        the dependency paths it needs and receives their results; the stack holds one
+        generator per module on the current dependency chain.
+        """
+        stack = []        # (module_path, steps generator) for every module being initialized
+        result = None     # Value sent into the generator on top of the stack
+        next_path = module_path
+        
+        while True:
+            if next_path is not None:
+                result = self._get_initialization_state(next_path)
+                if result is None:
+                    # Not seen before: add to initialization chain for cycle detection
+                    self.initialization_chain.append(next_path)
+                    self.initialization_chain_set.add(next_path)
+                    stack.append((next_path, self._initialize_module_steps(next_path, all_modules_info)))
+                elif not stack:
+                    return result
+                next_path = None
+            
+            current_path, steps = stack[-1]
+            try:
+                next_path = steps.send(result)
+            except StopIteration as finished:
+                # Remove from initialization chain
+                stack.pop()
+                self.initialization_chain.pop()
+                self.initialization_chain_set.discard(current_path)
+                result = finished.value
+                if not stack:
+                    return result
+
+    def _get_initialization_state(self, module_path: str) -> Optional[bool]:
+        """Return the known outcome for a module, or None if it still has to be initialized."""
         # Check if module is already initialized
         if module_path in self.initialized_modules:
             return True
@@ -160,67 +411,73 @@ class ModulesInitializer:
             return False
         
         # Check for circular dependency
-        if module_path in self.initialization_chain:
+        if module_path in self.initialization_chain_set:
             self._handle_circular_dependency(module_path)
             return False
         
-        # Add to initialization chain for cycle detection
-        self.initialization_chain.append(module_path)
-        
-        try:
-            # Get module information
-            module_info = all_modules_info.get(module_path)
-            if not module_info:
-                module_info = ModulesController.get_module_info_from_path(module_path)
-            
-            module_name = module_info.name if module_info else os.path.basename(module_path)
-            
-            # Display module initialization header
-            self._display_module_header(module_name, module_path, module_info)
-            
-            # Initialize dependencies first
-            if not self._initialize_dependencies(module_info, all_modules_info):
-                print(f"   ❌ Dependency initialization failed for {module_name}")
-                self.failed_modules.add(module_path)
-                return False
-            
-            # Initialize the module itself
-            success = self._perform_module_initialization(module_path, module_info, module_name)
-            
-            if success:
-                self.initialized_modules.add(module_path)
-                print(f"   ✅ Successfully initialized {module_name}")
-            else:
-                self.failed_modules.add(module_path)
-                print(f"   ❌ Failed to initialize {module_name}")
-            
-            return success
-            
-        finally:
-            # Remove from initialization chain
-            if module_path in self.initialization_chain:
-                self.initialization_chain.remove(module_path)
+        return None
 
-    def _initialize_dependencies(self, module_info, all_modules_info: dict) -> bool:
-        """Initialize all dependencies for a module."""
-        if not module_info or not module_info.requirements:
-            return True  # No dependencies to initialize
+    def _initialize_module_steps(self, module_path: str, all_modules_info: dict):
+        """Generator initializing one module: yields dependency paths, receives their results."""
+        # Get module information
+        module_info = self._get_module_info(module_path, all_modules_info)
         
-        print(f"   🔗 Initializing {len(module_info.requirements)} dependencies...")
+        module_name = module_info.name if module_info else os.path.basename(module_path)
         
-        for requirement_url in module_info.requirements:
-            dependency_path = self._resolve_dependency_path(requirement_url)
-            
-            if not dependency_path:
-                print(f"   ⚠️  Dependency skipped: {requirement_url}")
-                continue
+        # Display module initialization header
+        self._display_module_header(module_name, module_path, module_info)
+        
+        # Initialize dependencies first
+        if module_info and module_info.requirements:
+            print(f"   🔗 Initializing {len(module_info.requirements)} dependencies...")
             
-            if not self._initialize_module_with_dependencies(dependency_path, all_modules_info):
-                dependency_name = os.path.basename(dependency_path)
-                print(f"   ❌ Failed to initialize dependency: {dependency_name}")
-                return False
+            resolved_requirements = [(url, self._resolve_dependency_path(url)) for url in module_info.requirements]
+            for requirement_url, dependency_path in resolved_requirements:
+                if not dependency_path:
+                    print(f"   ⚠️  Dependency skipped: {requirement_url}")
+                    continue
+                
+                if not (yield dependency_path):
+                    dependency_name = os.path.basename(dependency_path)
+                    print(f"   ❌ Failed to initialize dependency: {dependency_name}")
+                    print(f"   ❌ Dependency initialization failed for {module_name}")
+                    self.failed_modules.add(module_path)
+                    return False
         
-        return True
+        # Initialize the module itself
+        success = self._perform_module_initialization(module_path, module_info, module_name)
+        
+        if success:
+            self.initialized_modules.add(module_path)
+            print(f"   ✅ Successfully initialized {module_name}")
+        else:
+            self.failed_modules.add(module_path)
+            print(f"   ❌ Failed to initialize {module_name}")
+        
+        return success
+
+    @staticmethod
+    def _normalize_dependency_url(url: str) -> str:
+        """Normalize a dependency URL for matching (remove .git, case insensitive)."""
+        return normalize_repo_url(url)
+
+    @staticmethod
+    def _dependency_repo_name(url: str) -> str:
+        """Repository name of a dependency URL, used as a last-resort match."""
+        name = url.rstrip('/').rsplit('/', 1)[-1].rsplit(':', 1)[-1].lower()
+        return name[:-4] if name.endswith('.git') else name
+
+    def _build_dependency_indexes(self):
+        """Index the URL-to-path mapping by normalized URL and by repository name."""
+        self._normalized_url_index = {}
+        self._repo_name_index = {}
+        for url, path in self.url_to_path_mapping.items():
+            self._normalized_url_index.setdefault(self._normalize_dependency_url(url), path)
+            repo_name = self._dependency_repo_name(url)
+            if self._repo_name_index.get(repo_name, path) != path:
+                self._repo_name_index[repo_name] = None  # Ambiguous name, never match on it
+            else:
+                self._repo_name_index[repo_name] = path
 
     def _resolve_dependency_path(self, requirement_url: str) -> str:
         """Resolve a requirement URL to its local module path."""
@@ -229,13 +486,12 @@ class ModulesInitializer:
             return self.url_to_path_mapping[requirement_url]
         
         # Try normalized URL matching (remove .git, case insensitive)
-        normalized_url = requirement_url.lower().rstrip('.git')
-        
-        for url, path in self.url_to_path_mapping.items():
-            if url.lower().rstrip('.git') == normalized_url:
-                return path
+        path = self._normalized_url_index.get(self._normalize_dependency_url(requirement_url))
+        if path:
+            return path
         
-        return None
+        # Fall back to a unique repository name match
+        return self._repo_name_index.get(self._dependency_repo_name(requirement_url))
 
     def _perform_module_initialization(self, module_path: str, module_info, module_name: str) -> bool:
         """Perform the actual initialization of a module."""
@@ -245,20 +501,9 @@ class ModulesInitializer:
             print(f"   ℹ️  No initialization needed for {module_name}")
             return True
         
-        init_path = os.path.join(module_path, '__init__.py')
-        
         try:
             print(f"   🔄 Running __init__.py...")
-            result = subprocess.run(
-                [sys.executable, init_path], 
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            
-            if result.stdout.strip():
-                print(f"   📝 Output: {result.stdout.strip()}")
-            
+            self._run_init_script(module_info.init_path)
             return True
             
         except subprocess.CalledProcessError as e:
@@ -268,6 +513,32 @@ class ModulesInitializer:
             print(f"   ❌ Unexpected error initializing {module_name}: {str(e)}")
             return False
 
+    def _run_init_script(self, init_path: str):
+        """Run a module's __init__.py, streaming its stdout line by line; raises CalledProcessError on failure."""
+        proc = subprocess.Popen(
+            [sys.executable, init_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        # Drain stderr on a side thread so a chatty script cannot block on a full pipe
+        stderr_lines: List[str] = []
+        stderr_reader = threading.Thread(target=lambda: stderr_lines.extend(proc.stderr), daemon=True)
+        stderr_reader.start()
+        
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line:
+                print(f"   📝 {line}", flush=True)
+        
+        returncode = proc.wait()
+        stderr_reader.join()
+        proc.stdout.close()
+        proc.stderr.close()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, proc.args, stderr=''.join(stderr_lines))
+
     def _handle_circular_dependency(self, module_path: str):
         """Handle circular dependency detection."""
         module_name = os.path.basename(module_path)
@@ -284,7 +555,7 @@ class ModulesInitializer:
         source_path = module_dir / f"{module_name}.instructions.md"
 
         destination_dir = Path(".github") / "instructions"
-        destination_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(destination_dir)
 
         if source_path.exists() and source_path.is_file():
             destination_path = destination_dir / source_path.name
@@ -311,17 +582,18 @@ class ModulesInitializer:
 
     def _handle_initialization_error(self, module_name: str, error: subprocess.CalledProcessError):
         """Handle module initialization errors with detailed reporting."""
-        print(f"   ❌ Error initializing {module_name}")
-        print(f"   📋 Return code: {error.returncode}")
+        # One write for the whole report
+        lines = [f"   ❌ Error initializing {module_name}", f"   📋 Return code: {error.returncode}"]
         
         if error.stderr and error.stderr.strip():
-            print(f"   📋 Error details: {error.stderr.strip()}")
+            lines.append(f"   📋 Error details: {error.stderr.strip()}")
         
         if error.stdout and error.stdout.strip():
-            print(f"   📋 Output: {error.stdout.strip()}")
+            lines.append(f"   📋 Output: {error.stdout.strip()}")
         
         if not error.stderr and not error.stdout:
-            print(f"   📋 No error output available")
+            lines.append(f"   📋 No error output available")
+        print("\n".join(lines))
 
     def _display_module_header(self, module_name: str, module_path: str, module_info):
         """Display a formatted header for module initialization."""
@@ -345,23 +617,25 @@ class ModulesInitializer:
         
         StaticPrintout.initialization_summary_header()
         
-        print(f"📦 Total modules: {total_modules}")
-        print(f"✅ Successfully initialized: {successful_modules}")
-        print(f"❌ Failed to initialize: {failed_modules}")
+        # Build the summary first and write it once
+        lines = [
+            f"📦 Total modules: {total_modules}",
+            f"✅ Successfully initialized: {successful_modules}",
+            f"❌ Failed to initialize: {failed_modules}",
+        ]
         
         if failed_modules > 0:
-            print(f"\n❌ Failed modules:")
-            for module_path in self.failed_modules:
-                module_name = os.path.basename(module_path)
-                print(f"   • {module_name}")
-            print()
+            lines.append(f"\n❌ Failed modules:")
+            lines.extend(f"   • {os.path.basename(module_path)}" for module_path in self.failed_modules)
+            lines.append("")
         
         if successful_modules == total_modules:
-            print("🎉 All modules initialized successfully!")
+            lines.append("🎉 All modules initialized successfully!")
         elif successful_modules > 0:
-            print("⚠️  Some modules failed to initialize. Check output above for details.")
+            lines.append("⚠️  Some modules failed to initialize. Check output above for details.")
         else:
-            print("💥 No modules were successfully initialized.")
+            lines.append("💥 No modules were successfully initialized.")
+        print("\n".join(lines))
         
         # Show final module status
         StaticPrintout.final_module_status_header()
@@ -384,7 +658,7 @@ class InitYamlLoader:
         """
         StaticPrintout.configuration_loading_header()
         
-        yaml_file = YamlUtil.read_yaml(self.yaml_file)
+        yaml_file = YamlUtil.read_yaml_cached(self.yaml_file)
         if yaml_file is None:
             print(f"❌ Error: Configuration file '{self.yaml_file}' not found or invalid.")
             return []
@@ -404,16 +678,25 @@ class InitYamlLoader:
 class RepositoryCloner:
     """A class to handle cloning repositories directly to their target locations using remote init.yaml files."""
     
-    def __init__(self, repo_urls: List[str], force_update: bool = False, use_ssh: bool = False, ssh_key: Optional[str] = None):
+    def __init__(self, repo_urls: List[str], force_update: bool = False, use_ssh: bool = False, ssh_key: Optional[str] = None, max_workers: int = 8, shallow: bool = True, submodules: bool = False, ssh_multiplex: bool = False):
         self.repo_urls = repo_urls
         self.force_update = force_update
         self.use_ssh = use_ssh
         self.ssh_key = ssh_key
+        self.ssh_multiplex = ssh_multiplex
+        self.max_workers = max_workers
+        self.shallow = shallow
+        self.submodules = submodules
         self.successful_clones = 0
         self.processed_repos = set()  # Track processed repositories to avoid infinite loops
         self.url_to_path_mapping = {}   # Track URL to final path mappings
         self._prepared_clones: Dict[str, str] = {}
-        self._clone_tmp_root = ".adhd_clone_tmp"
+        self._clone_tmp_root = CLONE_TMP_DIR
+        self._print_lock = threading.Lock()      # Keeps tables from concurrent clones intact
+        self._target_locks: Dict[str, threading.Lock] = {}
+        self._target_locks_guard = threading.Lock()
+        self._cached_git_env: Optional[dict] = None
+        self._git_env_lock = threading.Lock()
         
     def get_url_to_path_mapping(self) -> Dict[str, str]:
         """Get the URL to path mapping for dependency resolution."""
@@ -421,7 +704,7 @@ class RepositoryCloner:
     
     def _normalize_repo_url(self, repo_url: str) -> str:
         """Normalize repository URL to avoid duplicates with different formats."""
-        return repo_url.lower().rstrip('.git')
+        return normalize_repo_url(repo_url)
 
     def _to_ssh_url(self, repo_url: str) -> str:
         """Convert a GitHub https URL to SSH form if needed."""
@@ -438,37 +721,131 @@ class RepositoryCloner:
         return repo_url
 
     def _git_env(self) -> dict:
+        """Environment for git subprocesses, built once and shared by every clone."""
+        if self._cached_git_env is not None:
+            return self._cached_git_env
+        with self._git_env_lock:
+            if self._cached_git_env is None:
+                # Publish only the finished env so no worker clones without the ssh options
+                self._cached_git_env = self._build_git_env()
+        return self._cached_git_env
+
+    def _build_git_env(self) -> dict:
+        """Copy of os.environ with prompts disabled and the requested ssh options applied."""
         env = os.environ.copy()
+        env["GIT_TERMINAL_PROMPT"] = "0"  # Fail fast instead of waiting on credential prompts
+        
+        ssh_options = []
         if self.ssh_key:
-            env["GIT_SSH_COMMAND"] = f"ssh -i {self.ssh_key} -o IdentitiesOnly=yes -o StrictHostKeyChecking=accept-new"
+            ssh_options.append(f"-i {self.ssh_key} -o IdentitiesOnly=yes -o StrictHostKeyChecking=accept-new")
+        elif not self.ssh_multiplex or self._has_user_ssh_command(env):
+            return env  # Leave the user's ssh setup alone
+        
+        control_dir = self._ssh_control_dir() if self.ssh_multiplex else None
+        if control_dir:
+            # Multiplex all SSH clones over one connection per host instead of a handshake per repo
+            control_path = os.path.join(control_dir, "%C")
+            ssh_options.append(f"-o ControlMaster=auto -o ControlPath={control_path} -o ControlPersist=10")
+        if ssh_options:
+            env["GIT_SSH_COMMAND"] = "ssh " + " ".join(ssh_options)
         return env
 
+    @staticmethod
+    def _has_user_ssh_command(env: dict) -> bool:
+        """Whether git is already told which ssh to run (GIT_SSH_COMMAND, GIT_SSH or core.sshCommand)."""
+        if env.get("GIT_SSH_COMMAND") or env.get("GIT_SSH"):
+            return True
+        result = subprocess.run(["git", "config", "--get", "core.sshCommand"],
+                                capture_output=True, text=True, env=env)
+        return result.returncode == 0 and bool(result.stdout.strip())
+
+    @staticmethod
+    def _ssh_control_dir() -> Optional[str]:
+        """Private per-user directory for ssh control sockets, or None if one is not available."""
+        if os.name == "nt":
+            return None
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        base_dir = runtime_dir if runtime_dir else os.path.join(os.path.expanduser("~"), ".ssh")
+        control_dir = os.path.join(base_dir, "adhd-control")
+        try:
+            os.makedirs(base_dir, mode=0o700, exist_ok=True)
+            os.makedirs(control_dir, mode=0o700, exist_ok=True)
+            info = os.lstat(control_dir)
+        except OSError:
+            return None
+        # Refuse a directory someone else owns or can write to
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+            return None
+        return control_dir
+
+    def _print_table(self, table: TableFormatter):
+        """Print a rendered table without interleaving output from other clone workers."""
+        rendered = f"\n{table.render('normal', 70)}\n"
+        with self._print_lock:
+            sys.stdout.write(rendered)
+            sys.stdout.flush()
+
+    def _target_lock(self, target_path: str) -> threading.Lock:
+        """Lock serializing clones that resolve to the same target folder."""
+        with self._target_locks_guard:
+            return self._target_locks.setdefault(os.path.normpath(target_path), threading.Lock())
+
+    def _submodule_args(self, shallow: bool) -> List[str]:
+        """git clone flags fetching submodules in parallel (a no-op for repos without any)."""
+        if not self.submodules:
+            return []
+        args = ['--recurse-submodules', f'--jobs={SUBMODULE_JOBS}']
+        if shallow:
+            args.append('--shallow-submodules')
+        return args
+
     def _clone_to_temp(self, repo_url: str) -> Optional[str]:
-        os.makedirs(self._clone_tmp_root, exist_ok=True)
+        ensure_dir(self._clone_tmp_root)
         repo_name = YamlUtil.get_repo_name(repo_url) or "repo"
-        tmp_path = os.path.join(self._clone_tmp_root, f"{repo_name}")
-        shutil.rmtree(tmp_path, ignore_errors=True)
+        # Unique per clone, repos with the same name may be fetched concurrently
+        tmp_path = tempfile.mkdtemp(prefix=f"{repo_name}-", dir=self._clone_tmp_root)
         ssh_url = self._to_ssh_url(repo_url)
         try:
             subprocess.run(
-                ["git", "clone", "--depth", "1", ssh_url, tmp_path],
-                capture_output=True,
+                ["git", "clone", "--quiet", "--depth", "1", "--no-tags", *self._submodule_args(True), ssh_url, tmp_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
                 env=self._git_env(),
             )
             return tmp_path
         except subprocess.CalledProcessError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
             return None
 
     def _cleanup_temp_clones(self):
-        shutil.rmtree(self._clone_tmp_root, ignore_errors=True)
+        """Remove prepared clones, and any an interrupted run left behind, without holding up the rest of the run."""
+        if os.path.lexists(self._clone_tmp_root):
+            try:
+                os.rename(self._clone_tmp_root, f"{self._clone_tmp_root}.del.{os.getpid()}")  # Frees the name at once
+            except OSError:
+                shutil.rmtree(self._clone_tmp_root, ignore_errors=True)
+        doomed = glob.glob(f"{glob.escape(self._clone_tmp_root)}.del.*")
+        if not doomed:
+            return  # Nothing was prepared (the usual case without SSH)
+        
+        def remove_all():
+            for path in doomed:
+                shutil.rmtree(path, ignore_errors=True)
+        
+        # Non-daemon thread: the interpreter waits for it before exiting
+        threading.Thread(target=remove_all).start()
     
     def _fetch_remote_init_yaml(self, repo_url: str) -> Optional[YamlFile]:
         """Fetch and parse remote init.yaml file."""
-        raw_url = YamlUtil.construct_github_raw_url(repo_url, 'init.yaml')
-        if raw_url:
-            data = YamlUtil.read_yaml_from_url(raw_url)
+        # Non-GitHub URLs get no raw URL and skip the HTTP round-trip entirely.
+        # "main" first, then "HEAD" (the default branch) for repos still on e.g. "master".
+        for branch in ("main", "HEAD"):
+            raw_url = YamlUtil.construct_github_raw_url(repo_url, 'init.yaml', branch)
+            if not raw_url:
+                break
+            data = YamlUtil.read_yaml_from_url(raw_url, REMOTE_HEADER_KEYS)
             if data:
                 return data
         # Fallback for private repos via SSH shallow clone
@@ -503,42 +880,54 @@ class RepositoryCloner:
         cloned_paths = []
         
         print(f"🎯 Starting with {len(repos_to_process)} initial repositories")
+        self._cleanup_temp_clones()  # Sweep scratch clones left by an interrupted run
         
         level = 0
         while repos_to_process:
             level += 1
-            current_batch = repos_to_process.copy()
-            repos_to_process.clear()
+            # Take the whole level and start collecting the next one, no copying
+            current_batch, repos_to_process = repos_to_process, []
             
             StaticPrintout.dependency_level_header(level)
             print(f"🔍 Processing {len(current_batch)} repositories at level {level}")
             
+            # Skip already processed repositories, then clone the rest concurrently
+            pending = []
             for i, repo_url in enumerate(current_batch, 1):
                 normalized_url = self._normalize_repo_url(repo_url)
                 
-                # Skip if already processed
+                # Skip if already processed (one line, no table: nothing happens for these)
                 if normalized_url in self.processed_repos:
-                    table = TableFormatter()
-                    table.set_title(f"⏭️  REPOSITORY {i:2d}/{len(current_batch):2d} (Level {level})")
-                    table.add_row(TableRow(f"📦 Repository: {YamlUtil.get_repo_name(repo_url) or 'Unknown'}"))
-                    table.add_row(TableRow("ℹ️  Status: Already processed"))
-                    print(f"\n{table.render('normal', 70)}")
+                    repo_name = YamlUtil.get_repo_name(repo_url) or repo_url.rstrip('/').rpartition('/')[2].removesuffix('.git')
+                    print(f"⏭️  [{i:2d}/{len(current_batch):2d}] {repo_name}: already processed")
                     continue
                 
                 # Mark as processed
                 self.processed_repos.add(normalized_url)
-                
-                clone_path = self._clone_single_repository(repo_url, i, len(current_batch), level)
+                pending.append((i, repo_url))
+            
+            def clone_and_scan(item):
+                # Read the module's dependencies in the same worker, while sibling clones are still running
+                clone_path = self._clone_single_repository(item[1], item[0], len(current_batch), level)
+                return clone_path, (self._get_dependencies_from_cloned_repo(clone_path) if clone_path else [])
+            
+            ModulesController._load_yaml_info_cache()  # Load once up front, before any worker threads
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(pending) or 1))) as executor:
+                results = list(executor.map(clone_and_scan, pending))
+            
+            # Collect results in batch order so dependency discovery stays deterministic
+            for (_, repo_url), (clone_path, dependencies) in zip(pending, results):
                 if clone_path:
+                    # Record every placed module, kept existing ones included, for dependency resolution
+                    self.url_to_path_mapping[repo_url] = clone_path
                     cloned_paths.append(clone_path)
                     self.successful_clones += 1
                     
-                    # Get dependencies from the cloned repository
-                    dependencies = self._get_dependencies_from_cloned_repo(clone_path)
-                    
-                    # Process new dependencies
+                    # Process new dependencies, each distinct repository once (first spelling wins)
+                    new_dependencies = {}
                     for dep_url in dependencies:
-                        normalized_dep = self._normalize_repo_url(dep_url)
+                        new_dependencies.setdefault(self._normalize_repo_url(dep_url), dep_url)
+                    for normalized_dep, dep_url in new_dependencies.items():
                         if normalized_dep not in all_discovered_repos:
                             all_discovered_repos.add(normalized_dep)
                             repos_to_process.append(dep_url)
@@ -550,10 +939,12 @@ class RepositoryCloner:
         
         # Final summary
         StaticPrintout.recursive_cloning_summary_header()
-        print(f"🎯 Total repositories discovered: {len(all_discovered_repos)}")
-        print(f"✅ Successfully processed: {len(self.processed_repos)}")
-        print(f"📦 Successfully cloned: {self.successful_clones}")
-        print(f"📈 Dependency levels processed: {level}")
+        sys.stdout.write(
+            f"🎯 Total repositories discovered: {len(all_discovered_repos)}\n"
+            f"✅ Successfully processed: {len(self.processed_repos)}\n"
+            f"📦 Successfully cloned: {self.successful_clones}\n"
+            f"📈 Dependency levels processed: {level}\n"
+        )
         # Cleanup temp clones
         self._cleanup_temp_clones()
         
@@ -574,13 +965,13 @@ class RepositoryCloner:
         
         if not init_data:
             table.add_row(TableRow("❌ No init.yaml found, skipping module"))
-            print(f"\n{table.render('normal', 70)}")
+            self._print_table(table)
             return None
         
         folder_path = init_data.get('folder_path')
         if not folder_path:
             table.add_row(TableRow("❌ No folder_path specified in init.yaml, skipping module"))
-            print(f"\n{table.render('normal', 70)}")
+            self._print_table(table)
             return None
             
         target_path = folder_path
@@ -589,11 +980,27 @@ class RepositoryCloner:
         if init_data.has_value('version'):
             table.add_row(TableRow(f"🏷️  Version: {init_data.get('version')}"))
         
+        with self._target_lock(target_path):
+            return self._place_repository(repo_url, target_path, init_data, table)
+    
+    def _remove_existing_module(self, target_path: str, table: TableFormatter) -> bool:
+        """Delete a module folder before re-cloning it; report and give up if anything is left behind."""
+        try:
+            remove_tree(target_path)
+            return True
+        except OSError as e:
+            table.add_row(TableRow(f"❌ Could not remove existing module: {e}"))
+            self._print_table(table)
+            return False
+    
+    def _place_repository(self, repo_url: str, target_path: str, init_data: YamlFile, table: TableFormatter) -> Optional[str]:
+        """Clone or move a repository into its target folder, honouring existing versions."""
         # Check if target already exists
         if os.path.exists(target_path):
             if self.force_update:
                 table.add_row(TableRow("⚡ Force mode: Removing existing module"))
-                shutil.rmtree(target_path, ignore_errors=True)
+                if not self._remove_existing_module(target_path, table):
+                    return None
             else:
                 existing_info = ModulesController.get_module_info_from_path(target_path)
                 if existing_info and init_data:
@@ -604,18 +1011,23 @@ class RepositoryCloner:
                     
                     if not self._should_update(existing_version, new_version):
                         table.add_row(TableRow("⚠️  Keeping existing (newer/same version)", -3))
-                        print(f"\n{table.render('normal', 70)}")
+                        self._print_table(table)
                         return target_path  # Still return path for dependency tracking
                     else:
                         table.add_row(TableRow("✅ Updating to newer version"))
-                        shutil.rmtree(target_path, ignore_errors=True)
+                        if self._update_in_place(repo_url, target_path):
+                            table.add_row(TableRow("✅ Fetched the new version in place"))
+                            self._print_table(table)
+                            return target_path
+                        if not self._remove_existing_module(target_path, table):
+                            return None
                 else:
                     table.add_row(TableRow("⚠️  Existing module found, keeping", -3))
-                    print(f"\n{table.render('normal', 70)}")
+                    self._print_table(table)
                     return target_path
         
         # Ensure target directory exists
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        ensure_dir(os.path.dirname(target_path))
         
         # Clone repository or move prepared temp clone
         normalized_url = self._normalize_repo_url(repo_url)
@@ -625,39 +1037,93 @@ class RepositoryCloner:
             try:
                 shutil.move(tmp_path, target_path)
                 table.add_row(TableRow("✅ Successfully placed module"))
-                self.url_to_path_mapping[repo_url] = target_path
-                print(f"\n{table.render('normal', 70)}")
+                self._print_table(table)
                 return target_path
             except Exception as e:
                 table.add_row(TableRow(f"❌ Move failed: {str(e)}"))
-                print(f"\n{table.render('normal', 70)}")
+                self._print_table(table)
                 return None
 
         table.add_row(TableRow("🔄 Cloning repository..."))
         clone_url = self._to_ssh_url(repo_url) if (self.use_ssh or repo_url.startswith(("git@", "ssh://"))) else repo_url
+        if not clone_url.startswith(("git@", "ssh://")) and self._clone_in_process(clone_url, target_path):
+            table.add_row(TableRow("✅ Successfully cloned"))
+            self._print_table(table)
+            return target_path
         try:
+            shallow_args = ['--depth', '1', '--single-branch', '--no-tags'] if self.shallow else []
             subprocess.run(
-                ['git', 'clone', clone_url, target_path],
-                capture_output=True,
+                ['git', 'clone', '--quiet', *shallow_args, *self._submodule_args(self.shallow), clone_url, target_path],
+                stdout=subprocess.DEVNULL,  # Only stderr is reported, and only on failure
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
                 env=self._git_env(),
             )
             table.add_row(TableRow("✅ Successfully cloned"))
-            self.url_to_path_mapping[repo_url] = target_path
-            print(f"\n{table.render('normal', 70)}")
+            self._print_table(table)
             return target_path
             
         except subprocess.CalledProcessError as e:
             error_msg = str(e.stderr).strip() if e.stderr else "Unknown error"
             table.add_row(TableRow(f"❌ Clone failed: {error_msg}"))
-            print(f"\n{table.render('normal', 70)}")
+            self._print_table(table)
             return None
         except Exception as e:
             table.add_row(TableRow(f"❌ Unexpected error: {str(e)}"))
-            print(f"\n{table.render('normal', 70)}")
+            self._print_table(table)
             return None
     
+    def _update_in_place(self, repo_url: str, target_path: str) -> bool:
+        """Move an existing clone to the remote's current tip, fetching only new objects; False means re-clone."""
+        if not os.path.isdir(os.path.join(target_path, ".git")):
+            return False
+        fetch_url = self._to_ssh_url(repo_url) if (self.use_ssh or repo_url.startswith(("git@", "ssh://"))) else repo_url
+        depth_args = ['--depth', '1'] if self.shallow else []
+        commands = [
+            ['git', '-C', target_path, 'fetch', '--quiet', '--no-tags', *depth_args, fetch_url],
+            # Same end state as a fresh clone: tracked files at the new tip, leftovers removed
+            ['git', '-C', target_path, 'reset', '--quiet', '--hard', 'FETCH_HEAD'],
+            ['git', '-C', target_path, 'clean', '--quiet', '-ffdx'],
+        ]
+        if self.submodules and os.path.exists(os.path.join(target_path, ".gitmodules")):
+            commands.append(['git', '-C', target_path, 'submodule', '--quiet', 'update', '--init', '--recursive',
+                             f'--jobs={SUBMODULE_JOBS}', *depth_args])
+        try:
+            for command in commands:
+                subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True, env=self._git_env())
+            return True
+        except (subprocess.CalledProcessError, OSError):
+            return False
+    
+    def _clone_in_process(self, clone_url: str, target_path: str) -> bool:
+        """Clone through libgit2 (pygit2) when installed, saving a git process per module; False means use the CLI."""
+        try:
+            import pygit2
+        except ImportError:
+            return False
+        
+        try:
+            if self.shallow:
+                pygit2.clone_repository(clone_url, target_path, depth=1)  # depth needs pygit2 >= 1.14
+            else:
+                pygit2.clone_repository(clone_url, target_path)
+            if self.submodules and os.path.exists(os.path.join(target_path, ".gitmodules")):
+                shallow_args = ['--depth', '1'] if self.shallow else []
+                subprocess.run(
+                    ['git', 'submodule', '--quiet', 'update', '--init', '--recursive', f'--jobs={SUBMODULE_JOBS}', *shallow_args],
+                    cwd=target_path,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    check=True,
+                    env=self._git_env(),
+                )
+            return True
+        except Exception:
+            # e.g. credentials only the git CLI's helpers can supply, or an older pygit2
+            shutil.rmtree(target_path, ignore_errors=True)
+            return False
+    
     def _get_dependencies_from_cloned_repo(self, repo_path: str) -> List[str]:
         """Get dependencies from a cloned repository."""
         module_info = ModulesController.get_module_info_from_path(repo_path)
@@ -667,14 +1133,6 @@ class RepositoryCloner:
     
     def _should_update(self, existing_version: str, new_version: str) -> bool:
         """Compare version strings to determine if update is needed."""
-        def parse_version(version_str: str) -> tuple:
-            try:
-                clean_version = version_str.lower().lstrip('v')
-                parts = clean_version.split('.')
-                return tuple(int(part) for part in parts[:3])
-            except (ValueError, AttributeError):
-                return (0, 0, 0)
-        
         existing_parsed = parse_version(existing_version)
         new_parsed = parse_version(new_version)
         
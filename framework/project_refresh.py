@@ -35,6 +35,8 @@ class ModulesRefresher:
         
         print(f"🔄 Refreshing module: {module_name}")
         
+        # Collect the result lines and emit them in a single write
+        lines = []
         try:
             # Run the refresh script from project root (like init.py does)
             result = subprocess.run(
@@ -45,37 +47,45 @@ class ModulesRefresher:
             )
             
             self.successful_refreshes += 1
-            print(f"   ✅ {module_name} refreshed successfully")
+            lines.append(f"   ✅ {module_name} refreshed successfully")
             
             # Print output if there is any (for debugging)
             if result.stdout.strip():
-                print(f"   📝 Output: {result.stdout.strip()}")
+                lines.append(f"   📝 Output: {result.stdout.strip()}")
             
         except subprocess.CalledProcessError as e:
             self.failed_refreshes += 1
             error_msg = f"Failed to refresh {module_name}: {e.stderr.strip() if e.stderr else str(e)}"
-            print(f"   ❌ {error_msg}")
+            lines.append(f"   ❌ {error_msg}")
             
         except Exception as e:
             self.failed_refreshes += 1
             error_msg = f"Unexpected error refreshing {module_name}: {str(e)}"
-            print(f"   ❌ {error_msg}")
+            lines.append(f"   ❌ {error_msg}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def _print_summary(self):
         """Print a summary of the refresh process."""
         total_modules = self.successful_refreshes + self.failed_refreshes
         
-        print("\n" + "="*50)
-        print("🔄 REFRESH SUMMARY")
-        print("="*50)
-        print(f"Total modules processed: {total_modules}")
-        print(f"✅ Successful refreshes: {self.successful_refreshes}")
-        print(f"❌ Failed refreshes: {self.failed_refreshes}")
+        lines = [
+            "",
+            "="*50,
+            "🔄 REFRESH SUMMARY",
+            "="*50,
+            f"Total modules processed: {total_modules}",
+            f"✅ Successful refreshes: {self.successful_refreshes}",
+            f"❌ Failed refreshes: {self.failed_refreshes}",
+        ]
         
         if self.failed_refreshes == 0:
-            print("🎉 All modules refreshed successfully!")
+            lines.append("🎉 All modules refreshed successfully!")
         else:
-            print("⚠️  Some modules failed to refresh. Check output above for details.")
+            lines.append("⚠️  Some modules failed to refresh. Check output above for details.")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 def refresh_specific_module(module_name: str):
     """Refresh a specific module by name."""
@@ -4,33 +4,139 @@ Framework Upgrade Module for ADHD Framework
 This module handles upgrading the framework and CLI from the self-template repository.
 """
 
+import collections
+import hashlib
 import os
 import sys
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from .cli_format import TableFormatter, TableRow, StaticPrintout
 from .yaml_util import YamlUtil, YamlFile
 
 
+def _fast_copy(source, target):
+    """copy2 replacement that lets the kernel copy (or reflink, on CoW filesystems) via copy_file_range."""
+    if not hasattr(os, "copy_file_range") or os.path.islink(source):
+        shutil.copy2(source, target)
+        return
+    with open(source, "rb") as source_file, open(target, "wb") as target_file:
+        remaining = os.fstat(source_file.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(source_file.fileno(), target_file.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            # e.g. ENOSYS, EXDEV or EINVAL on older kernels or some filesystems
+            source_file.seek(0)
+            target_file.seek(0)
+            target_file.truncate()
+            shutil.copyfileobj(source_file, target_file)
+    shutil.copystat(source, target)
+
+
+def _copy_tree(source, target):
+    """Copy a directory tree (merging into target): one inode-ordered scan per directory, files copied concurrently."""
+    directories = []   # (source, target) pairs, parents before children
+    file_copies = []   # (source, target) pairs
+    pending = [(os.fspath(source), os.fspath(target))]
+    while pending:
+        source_dir, target_dir = pending.pop()
+        os.makedirs(target_dir, exist_ok=True)
+        directories.append((source_dir, target_dir))
+        # Inode order keeps reads close to on-disk layout
+        with os.scandir(source_dir) as scanned:
+            entries = sorted(scanned, key=lambda entry: entry.inode())
+        for entry in entries:
+            destination = os.path.join(target_dir, entry.name)
+            if entry.is_dir():  # Follows symlinks, like shutil.copytree's default
+                pending.append((entry.path, destination))
+            else:
+                file_copies.append((entry.path, destination))
+    
+    # Per-file open/stat/close dominates small-file trees; the copies release the GIL for the I/O
+    if len(file_copies) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(file_copies))) as executor:
+            list(executor.map(lambda pair: _fast_copy(*pair), file_copies))  # Re-raises the first failure
+    else:
+        for source_file, target_file in file_copies:
+            _fast_copy(source_file, target_file)
+    
+    # Directory metadata last, after their contents were written
+    for source_dir, target_dir in reversed(directories):
+        shutil.copystat(source_dir, target_dir)
+
+
+# Template paths the upgrade replaces; nothing else is needed from the template repository
+UPGRADED_PATHS = ("framework", "adhd_cli.py", ".github/copilot-instructions.md", ".github/instructions")
+
+
+def _remove_tree_native(path):
+    """Delete a tree with the platform's native remover (rm -rf / rd /s /q), shutil.rmtree if that fails."""
+    if os.name == "nt":
+        command = ["cmd", "/c", "rd", "/s", "/q", os.fspath(path)]
+    else:
+        command = ["rm", "-rf", "--", os.fspath(path)]
+    try:
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    except OSError:
+        pass  # Remover not available, fall through to the Python walk
+    if os.path.lexists(path):
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _remove_tree_in_background(path):
+    """Start deleting a tree that is no longer referenced without waiting for it."""
+    # Non-daemon thread: the interpreter waits for it before exiting
+    threading.Thread(target=_remove_tree_native, args=(path,)).start()
+
+
 class FrameworkUpgrader:
     """Handles upgrading the framework from the self-template repository."""
     
+    # (absolute init.yaml path, mtime_ns, size) -> parsed config, shared by all instances
+    _config_cache: dict = {}
+    
     def __init__(self, init_yaml_path: str = "init.yaml"):
         self.init_yaml_path = init_yaml_path
         self.temp_dir = "temp_upgrade"
         self.current_dir = Path.cwd()
         self.self_template_repo = None
+        self.template_bundle_uri = None
         self._load_yaml()
     
     def _load_yaml(self):
         """Load configuration from init.yaml to get template_repo."""
-        yaml_file = YamlUtil.read_yaml(self.init_yaml_path)
+        yaml_file = self._read_config()
         self.self_template_repo = yaml_file.get('template_repo')
 
         if not isinstance(self.self_template_repo, str):
             raise ValueError("Invalid 'template_repo' format in init.yaml")
+        
+        # Optional pre-built git bundle of the template (URL or local path), fetched in one request
+        bundle_uri = yaml_file.get('template_bundle_uri')
+        if bundle_uri is not None and not isinstance(bundle_uri, str):
+            raise ValueError("Invalid 'template_bundle_uri' format in init.yaml")
+        self.template_bundle_uri = bundle_uri
+    
+    def _read_config(self) -> YamlFile:
+        """Parse init.yaml, reusing this process's earlier parse while the file is unchanged."""
+        try:
+            stat = os.stat(self.init_yaml_path)
+        except OSError:
+            return YamlUtil.read_yaml(self.init_yaml_path)  # Let read_yaml report the problem
+        
+        key = (os.path.abspath(self.init_yaml_path), stat.st_mtime_ns, stat.st_size)
+        yaml_file = FrameworkUpgrader._config_cache.get(key)
+        if yaml_file is None:
+            yaml_file = YamlUtil.read_yaml(self.init_yaml_path)
+            FrameworkUpgrader._config_cache[key] = yaml_file
+        return yaml_file
     
     def _clone_template_repo(self) -> bool:
         """Clone the self-template repository to the temp directory."""
@@ -41,13 +147,23 @@ class FrameworkUpgrader:
             if os.path.exists(self.temp_dir):
                 shutil.rmtree(self.temp_dir)
             
-            # Clone the repository
-            result = subprocess.run(
-                ['git', 'clone', self.self_template_repo, self.temp_dir],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            if self.template_bundle_uri and self._clone_from_bundle():
+                print("✅ Cloned template repository from bundle")
+                return True
+            
+            if self._download_template_archive():
+                print("✅ Downloaded template snapshot (no git history)")
+                return True
+            
+            # Only the current tree is needed, so fetch just the tip of the default branch
+            git_env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+            shallow_args = ['--depth', '1', '--single-branch', '--no-tags']
+            try:
+                self._run_git_clone(['git', 'clone', '--progress', *shallow_args, self.self_template_repo, self.temp_dir], git_env)
+            except subprocess.CalledProcessError:
+                # Some servers (e.g. dumb HTTP) cannot serve shallow clones, retry with full history
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
+                self._run_git_clone(['git', 'clone', '--progress', self.self_template_repo, self.temp_dir], git_env)
             
             print(f"✅ Successfully cloned template repository")
             return True
@@ -60,6 +176,121 @@ class FrameworkUpgrader:
             print(f"❌ Unexpected error during clone: {str(e)}")
             return False
     
+    @staticmethod
+    def _run_git_clone(command: list, env: dict):
+        """Run git clone, showing its progress on one live line; raises CalledProcessError with the last messages."""
+        # Redirected output (CI logs, the serve daemon) gets no progress, just the caller's completion line
+        live_progress = sys.stdout.isatty()
+        proc = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, bufsize=1, env=env)
+        recent_lines = collections.deque(maxlen=20)  # Only the tail is needed for error reports
+        for line in proc.stderr:  # Universal newlines also split git's \r progress updates
+            line = line.rstrip()
+            if line:
+                recent_lines.append(line)
+                if live_progress:
+                    sys.stdout.write(f"\r   ⏳ {line[:70]:<70}")
+                    sys.stdout.flush()
+        proc.stderr.close()
+        returncode = proc.wait()
+        if live_progress:
+            sys.stdout.write("\r" + " " * 76 + "\r")
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command, stderr="\n".join(recent_lines))
+    
+    def _clone_from_bundle(self) -> bool:
+        """Clone temp_dir from the configured git bundle: one plain download, no pack negotiation."""
+        print(f"   📦 Fetching template bundle from {self.template_bundle_uri}...")
+        git_env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+        bundle_path = self.template_bundle_uri
+        downloaded = None
+        try:
+            if YamlUtil.is_url(self.template_bundle_uri):
+                import tempfile
+                from .yaml_util import get_http_session
+                with get_http_session().get(self.template_bundle_uri, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    with tempfile.NamedTemporaryFile(suffix=".bundle", delete=False) as bundle_file:
+                        downloaded = bundle_path = bundle_file.name
+                        for chunk in response.iter_content(chunk_size=1 << 20):
+                            bundle_file.write(chunk)
+            self._run_git_clone(['git', 'clone', '--progress', bundle_path, self.temp_dir], git_env)
+            return True
+        except Exception as e:
+            error_msg = (e.stderr.strip() if isinstance(e, subprocess.CalledProcessError) and e.stderr else str(e))
+            print(f"   ⚠️  Bundle unavailable ({error_msg.splitlines()[-1] if error_msg else 'unknown error'}), falling back")
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            return False
+        finally:
+            if downloaded:
+                try:
+                    os.unlink(downloaded)
+                except OSError:
+                    pass
+    
+    def _download_template_archive(self) -> bool:
+        """Extract just the upgraded paths from a GitHub tarball of the default branch into temp_dir."""
+        repo_full_name = YamlUtil.get_repo_full_name(self.self_template_repo or "")
+        if not repo_full_name:
+            return False  # Not on GitHub, clone instead
+        
+        import tarfile
+        if not hasattr(tarfile, "data_filter"):
+            return False  # No safe extraction filter (before 3.10.12 / 3.11.4), clone instead
+        import requests
+        from .yaml_util import get_http_session
+        
+        url = f"https://github.com/{repo_full_name}/archive/HEAD.tar.gz"
+        extracted = 0
+        try:
+            with get_http_session().get(url, stream=True, timeout=30) as response:
+                if response.status_code != 200:
+                    return False  # e.g. private repository, clone with credentials instead
+                # Stream-decompress and skip everything the upgrade does not replace
+                with tarfile.open(fileobj=response.raw, mode="r|gz") as archive:
+                    for member in archive:
+                        _, _, relative_name = member.name.partition("/")  # Drop "<repo>-<sha>/"
+                        if not any(relative_name == path or relative_name.startswith(path + "/")
+                                   for path in UPGRADED_PATHS):
+                            continue
+                        member.name = relative_name
+                        archive.extract(member, self.temp_dir, filter="data")
+                        extracted += 1
+        except (requests.RequestException, tarfile.TarError, OSError):
+            extracted = 0
+        
+        if not extracted:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        return extracted > 0
+    
+    @staticmethod
+    def _fingerprint(path: Path) -> Optional[str]:
+        """blake2b over the relative names and contents of a file or tree (bytecode caches ignored); None if missing."""
+        if not path.exists():
+            return None
+        digest = hashlib.blake2b()
+        if path.is_file():
+            files = [path]
+        else:
+            files = sorted(
+                file for file in path.rglob("*")
+                if file.is_file() and "__pycache__" not in file.parts and file.suffix != ".pyc"
+            )
+        for file in files:
+            digest.update(file.relative_to(path).as_posix().encode("utf-8") + b"\0")
+            digest.update(file.read_bytes())
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def _is_up_to_date(self) -> bool:
+        """True if every upgraded path in the template matches the installed copy byte for byte."""
+        try:
+            return all(
+                self._fingerprint(Path(self.temp_dir) / path) == self._fingerprint(Path(path))
+                for path in UPGRADED_PATHS
+            )
+        except OSError:
+            return False  # Can't tell, upgrade as usual
+    
     def _backup_current_files(self) -> bool:
         """Create backups of current framework and CLI files."""
         print("💾 Creating backups of current files...")
@@ -70,19 +301,19 @@ class FrameworkUpgrader:
             
             # Backup framework directory
             if os.path.exists("framework"):
-                shutil.copytree("framework", backup_dir / "framework", dirs_exist_ok=True)
+                _copy_tree("framework", backup_dir / "framework")
                 print(f"   📁 Framework backed up to {backup_dir}/framework")
             
             # Backup adhd_cli.py
             if os.path.exists("adhd_cli.py"):
-                shutil.copy2("adhd_cli.py", backup_dir / "adhd_cli.py")
+                _fast_copy("adhd_cli.py", backup_dir / "adhd_cli.py")
                 print(f"   📄 CLI backed up to {backup_dir}/adhd_cli.py")
             
             # Backup .github/copilot-instructions.md if present
             copilot_src = Path(".github") / "copilot-instructions.md"
             if copilot_src.exists():
                 (backup_dir / ".github").mkdir(parents=True, exist_ok=True)
-                shutil.copy2(copilot_src, backup_dir / ".github" / "copilot-instructions.md")
+                _fast_copy(copilot_src, backup_dir / ".github" / "copilot-instructions.md")
                 print(f"   📄 Copilot instructions backed up to {backup_dir}/.github/copilot-instructions.md")
             
             print(f"✅ Backup created in {backup_dir}")
@@ -144,21 +375,37 @@ class FrameworkUpgrader:
                 print(f"❌ {human_name} not found in cloned repository")
                 return False
 
+            # The temp clone is discarded after the upgrade, so moving out of it is
+            # equivalent to copying; a rename is O(1) on the same filesystem.
             if is_dir:
-                # Replace directory
+                # Replace directory: rename the old one aside (O(1)), swap the new one in,
+                # and delete the old tree off the critical path
+                retired = None
                 if target.exists():
-                    shutil.rmtree(target)
-                    print(f"   🗑️  Removed old {human_name.lower()}")
-                shutil.copytree(source, target)
-                print(f"   📁 Copied new {human_name.lower()}")
+                    retired = target.with_name(f"{target.name}.old.{os.getpid()}")
+                    os.rename(target, retired)
+                try:
+                    try:
+                        os.rename(source, target)
+                    except OSError:
+                        _copy_tree(source, target)  # e.g. cross-device
+                except Exception:
+                    if retired is not None:
+                        shutil.rmtree(target, ignore_errors=True)
+                        os.rename(retired, target)  # Put the old version back
+                    raise
+                print(f"   📁 Installed new {human_name.lower()}")
+                if retired is not None:
+                    _remove_tree_in_background(retired)
+                    print(f"   🗑️  Removing old {human_name.lower()} in the background")
             else:
                 # Replace file
                 target.parent.mkdir(parents=True, exist_ok=True)
-                if target.exists():
-                    target.unlink()
-                    print(f"   🗑️  Removed old {human_name.lower()}")
-                shutil.copy2(source, target)
-                print(f"   📄 Copied new {human_name.lower()}")
+                try:
+                    os.replace(source, target)
+                except OSError:
+                    _fast_copy(source, target)  # e.g. cross-device
+                print(f"   📄 Installed new {human_name.lower()}")
 
             print(f"✅ {human_name} upgraded successfully")
             return True
@@ -170,7 +417,10 @@ class FrameworkUpgrader:
         """Remove the temporary directory."""
         try:
             if os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
+                # Rename aside so the name is free immediately, then delete off the critical path
+                retired = f"{self.temp_dir}.old.{os.getpid()}"
+                os.rename(self.temp_dir, retired)
+                _remove_tree_in_background(retired)
                 print("🧹 Cleaned up temporary files")
         except Exception as e:
             print(f"⚠️  Warning: Failed to cleanup temp directory: {str(e)}")
@@ -212,6 +462,13 @@ class FrameworkUpgrader:
                 self._display_upgrade_summary(False)
                 return False
             
+            # Nothing to back up or replace when the template matches what is installed
+            if self._is_up_to_date():
+                print("✅ Already up to date, nothing to upgrade")
+                self._cleanup_temp_dir()
+                self._display_upgrade_summary(True)
+                return True
+            
             # Step 2: Create backup (optional)
             if create_backup:
                 if not self._backup_current_files():
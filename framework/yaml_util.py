@@ -5,14 +5,75 @@ Provides YamlFile class for loaded YAML data operations and YamlUtil class
 for file I/O and utility functions.
 """
 
-import yaml
+import functools
 import os
 import re
-import urllib.request
+import sys
+import hashlib
+import pickle
+import threading
 from urllib.parse import urlparse
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, List
 
+# libyaml-backed loader when available, pure-Python SafeLoader otherwise. PyYAML is
+# imported on first parse, so runs served entirely from caches never load it.
+_yaml_loader = None
+
+# Directory holding pickled parses of YAML files, keyed by path, mtime and size
+YAML_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "adhd"
+
+# Keep-alive HTTP session shared by all remote fetches (and clone worker threads)
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """Return the shared pooled requests session, importing requests on first use."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                                  max_retries=Retry(total=2, backoff_factor=0.2))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_session = session
+    return _http_session
+
+
+# owner/repo in HTTPS and SSH GitHub URLs, tried in order
+GITHUB_REPO_PATTERNS = (
+    re.compile(r'github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$'),
+    re.compile(r'github\.com/([^/]+/[^/]+?)(?:/.*)?$'),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _github_full_name(url: str) -> Optional[str]:
+    """owner/repo of a GitHub URL, memoized since each URL is resolved several times per run."""
+    for pattern in GITHUB_REPO_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1).removesuffix('.git')
+    return None
+
+
+def load_yaml(stream) -> Any:
+    """Parse YAML with the fastest available loader, warning once per process if libyaml is unavailable."""
+    global _yaml_loader
+    import yaml
+    if _yaml_loader is None:
+        _yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        if _yaml_loader is yaml.SafeLoader:
+            print("⚠️  PyYAML was built without libyaml, falling back to the slower pure-Python loader "
+                  "(install libyaml and reinstall pyyaml to speed this up)", file=sys.stderr)
+    return yaml.load(stream, Loader=_yaml_loader)
+
 
 class YamlFile:
     """Represents a loaded YAML file with convenient data access methods."""
@@ -78,6 +139,7 @@ class YamlFile:
         if not target_path:
             return False
         
+        import yaml
         try:
             file_path = Path(file_path)
             # Create directory if it doesn't exist
@@ -136,25 +198,140 @@ class YamlUtil:
     
     @staticmethod
     def read_yaml(file_path: Union[str, Path]) -> Optional['YamlFile']:
+        import yaml
         try:
             file_path = Path(file_path)
             if not file_path.exists():
                 return None
                 
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file) or {}
-                return YamlFile(data, file_path)
+            # One read of the raw bytes; libyaml decodes UTF-8 itself and parses the buffer
+            # without calling back into Python for each chunk
+            with open(file_path, 'rb') as file:
+                contents = file.read()
+            return YamlFile(load_yaml(contents) or {}, file_path)
         except (yaml.YAMLError, IOError, UnicodeDecodeError):
             raise FileNotFoundError(f"Configuration file '{file_path}' not found or invalid")
     
     @staticmethod
-    def read_yaml_from_url(url: str) -> Optional['YamlFile']:
+    def read_yaml_keys(file_path: Union[str, Path], keys: List[str]) -> Optional['YamlFile']:
+        """Read only the given top-level keys of a block-style YAML file, falling back to a full parse."""
+        import yaml
         try:
-            with urllib.request.urlopen(url) as response:
-                content = response.read().decode('utf-8')
-                data = yaml.safe_load(content) or {}
-                return YamlFile(data, url)
-        except (urllib.error.URLError, yaml.YAMLError, UnicodeDecodeError):
+            with open(file_path, 'r', encoding='utf-8') as file:
+                text = file.read()
+        except FileNotFoundError:
+            return None
+        except (IOError, UnicodeDecodeError):
+            raise FileNotFoundError(f"Configuration file '{file_path}' not found or invalid")
+        
+        try:
+            return YamlFile(YamlUtil._load_yaml_keys(text, keys), Path(file_path))
+        except yaml.YAMLError:
+            raise FileNotFoundError(f"Configuration file '{file_path}' not found or invalid")
+    
+    @staticmethod
+    def _load_yaml_keys(text: str, keys: List[str]) -> Dict[str, Any]:
+        """Parse only the given top-level keys of block-style YAML text, falling back to a full parse."""
+        import yaml
+        
+        # Keep the wanted top-level blocks: a block starts at an unindented "key:" line and
+        # runs until the next unindented line. Anything fancier than that parses in full.
+        wanted = set(keys)
+        kept_lines = []
+        keep = False
+        for line in text.splitlines(keepends=True):
+            if line[:1] not in ('', ' ', '\t', '\n', '\r', '#', '-'):
+                key, sep, _ = line.partition(':')
+                if not sep or key.startswith(('---', '...', '{', '[', '&', '*', '?', '!', '%')):
+                    kept_lines = None
+                    break
+                keep = key.strip().strip('\'"') in wanted
+            elif line.startswith('---'):
+                kept_lines = None
+                break
+            if keep:
+                kept_lines.append(line)
+        
+        if kept_lines is not None:
+            try:
+                data = load_yaml(''.join(kept_lines))
+                if isinstance(data, dict) or data is None:
+                    return data or {}
+            except yaml.YAMLError:
+                pass  # e.g. an alias to a dropped block, parse the whole text below
+        
+        return load_yaml(text) or {}
+    
+    @staticmethod
+    def read_yaml_cached(file_path: Union[str, Path]) -> Optional['YamlFile']:
+        """Read a YAML file, reusing a pickled parse while its mtime and size are unchanged."""
+        file_path = Path(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        
+        resolved_path = str(file_path.resolve())
+        cache_key = (resolved_path, stat.st_mtime_ns, stat.st_size)
+        cache_file = YAML_CACHE_DIR / f"{hashlib.sha1(resolved_path.encode('utf-8')).hexdigest()}.pkl"
+        
+        try:
+            with open(cache_file, 'rb') as cache:
+                cached_key, data = pickle.load(cache)
+            if cached_key == cache_key:
+                return YamlFile(data, file_path)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            pass  # Missing or stale cache, parse the file below
+        
+        yaml_file = YamlUtil.read_yaml(file_path)
+        if yaml_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_file, 'wb') as cache:
+                    pickle.dump((cache_key, yaml_file.data), cache, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, cache_file)
+            except (OSError, pickle.PicklingError):
+                pass  # Caching is best effort
+        return yaml_file
+    
+    @staticmethod
+    def read_yaml_from_url(url: str, keys: Optional[List[str]] = None) -> Optional['YamlFile']:
+        """Fetch and parse a remote YAML file; with keys, only those top-level keys are parsed."""
+        import requests
+        import yaml
+        
+        # Conditional GET against the last ETag seen for this URL; a 304 reuses the cached body
+        cache_file = YAML_CACHE_DIR / "http" / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.pkl"
+        try:
+            with open(cache_file, 'rb') as cache:
+                cached_etag, cached_body = pickle.load(cache)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            cached_etag, cached_body = None, None
+        
+        try:
+            headers = {"If-None-Match": cached_etag} if cached_etag else {}
+            response = get_http_session().get(url, timeout=10, headers=headers)
+            if response.status_code == 304 and cached_body is not None:
+                body = cached_body
+            elif response.status_code == 200:
+                body = response.content
+                etag = response.headers.get("ETag")
+                if etag and etag != cached_etag:
+                    try:
+                        cache_file.parent.mkdir(parents=True, exist_ok=True)
+                        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                        with open(tmp_file, 'wb') as cache:
+                            pickle.dump((etag, body), cache, protocol=pickle.HIGHEST_PROTOCOL)
+                        os.replace(tmp_file, cache_file)
+                    except (OSError, pickle.PicklingError):
+                        pass  # Caching is best effort
+            else:
+                return None
+            text = body.decode('utf-8')
+            data = YamlUtil._load_yaml_keys(text, keys) if keys else load_yaml(text) or {}
+            return YamlFile(data, url)
+        except (requests.RequestException, yaml.YAMLError, UnicodeDecodeError):
             return None
     
     @staticmethod
@@ -169,21 +346,7 @@ class YamlUtil:
     def get_repo_full_name(url: str) -> Optional[str]:
         """Extract owner/repo from GitHub URL."""
         try:
-            # Handle both HTTPS and SSH GitHub URLs
-            patterns = [
-                r'github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$',
-                r'github\.com/([^/]+/[^/]+?)(?:/.*)?$'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, url)
-                if match:
-                    repo_full_name = match.group(1)
-                    # Remove .git suffix if present
-                    if repo_full_name.endswith('.git'):
-                        repo_full_name = repo_full_name[:-4]
-                    return repo_full_name
-            return None
+            return _github_full_name(url)
         except (AttributeError, TypeError):
             return None
     
@@ -192,7 +355,7 @@ class YamlUtil:
         """Extract just the repo name (without owner) from GitHub URL."""
         full_name = YamlUtil.get_repo_full_name(url)
         if full_name and '/' in full_name:
-            return full_name.split('/')[-1]
+            return full_name.rpartition('/')[2]
         return None
         
     @staticmethod
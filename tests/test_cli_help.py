@@ -0,0 +1,37 @@
+"""Keep the CLI's pre-rendered help in sync with what argparse would print."""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import adhd_cli
+
+PROG = "adhd_cli.py"
+
+
+class StaticHelpTest(unittest.TestCase):
+    """Compare the static help fast path and lazy subparsers against a full argparse build."""
+
+    def setUp(self):
+        # argparse wraps help text to the terminal width
+        patcher = mock.patch.dict(os.environ, {"COLUMNS": "80"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_static_help_matches_argparse(self):
+        parser = adhd_cli.build_parser(prog=PROG)
+        self.assertEqual(adhd_cli.STATIC_HELP % {"prog": PROG}, parser.format_help())
+
+    def test_subcommand_help_matches_full_parser(self):
+        full_subparsers = adhd_cli.build_parser(prog=PROG)._subparsers._group_actions[0].choices
+        for command in adhd_cli.COMMANDS:
+            with self.subTest(command=command):
+                lazy_subparsers = adhd_cli.build_parser(command, prog=PROG)._subparsers._group_actions[0].choices
+                self.assertEqual(list(lazy_subparsers), [command])
+                self.assertEqual(lazy_subparsers[command].format_help(), full_subparsers[command].format_help())
+
+
+if __name__ == "__main__":
+    unittest.main()
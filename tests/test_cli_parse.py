@@ -0,0 +1,35 @@
+"""Guard the CLI parser against argparse's quadratic option resolution."""
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import adhd_cli
+
+# Generous per-parse budget; a quadratic pathology takes orders of magnitude longer
+PARSE_BUDGET_SECONDS = 0.1
+
+
+class ParseBudgetTest(unittest.TestCase):
+    """Time building a subcommand parser and parsing a long argument list."""
+
+    def assert_within_budget(self, argv):
+        start = time.perf_counter()
+        args = adhd_cli.build_parser(argv[0]).parse_args(argv)
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, PARSE_BUDGET_SECONDS, f"parsing {len(argv)} tokens took {elapsed:.3f}s")
+        return args
+
+    def test_repeated_init_options(self):
+        args = self.assert_within_budget(['init'] + ['--config', 'x'] * 500)
+        self.assertEqual(args.config, 'x')
+
+    def test_repeated_refresh_options(self):
+        args = self.assert_within_budget(['refresh'] + ['--module', 'logger'] * 500)
+        self.assertEqual(args.module, 'logger')
+
+
+if __name__ == "__main__":
+    unittest.main()
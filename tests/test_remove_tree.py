@@ -0,0 +1,56 @@
+"""remove_tree must delete read-only files on every supported Python."""
+import os
+import stat
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from framework.project_init import _make_writable_and_retry_exc_info, remove_tree
+
+
+class RemoveTreeTest(unittest.TestCase):
+    """Delete trees the way a --force re-clone does."""
+
+    def setUp(self):
+        scratch = tempfile.TemporaryDirectory()
+        self.addCleanup(scratch.cleanup)
+        self.root = scratch.name
+
+    def test_removes_read_only_file(self):
+        tree = os.path.join(self.root, "module", ".git", "objects")
+        os.makedirs(tree)
+        read_only = os.path.join(tree, "pack")
+        with open(read_only, "w") as f:
+            f.write("x")
+        os.chmod(read_only, stat.S_IREAD)
+
+        remove_tree(os.path.join(self.root, "module"))
+
+        self.assertFalse(os.path.exists(os.path.join(self.root, "module")))
+
+    def test_onerror_hook_keeps_other_bits(self):
+        path = os.path.join(self.root, "pack")
+        with open(path, "w") as f:
+            f.write("x")
+        os.chmod(path, 0o444)
+        retried = []
+
+        _make_writable_and_retry_exc_info(retried.append, path, (PermissionError, PermissionError(), None))
+
+        self.assertEqual(retried, [path])
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o444 | stat.S_IWRITE)
+
+    def test_onerror_hook_reraises_other_errors(self):
+        error = FileNotFoundError("gone")
+        with self.assertRaises(FileNotFoundError):
+            _make_writable_and_retry_exc_info(os.unlink, self.root, (FileNotFoundError, error, None))
+
+    def test_missing_tree_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            remove_tree(os.path.join(self.root, "missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()